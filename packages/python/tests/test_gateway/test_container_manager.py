@@ -204,6 +204,25 @@ class TestContainerWorkerHandle:
         handle._emit("stderr", "should not appear")
         assert events == ["test message"]
 
+    def test_handler_removing_itself_does_not_skip_others(self):
+        handle = ContainerWorkerHandle(
+            "test-trik",
+            make_container_options(),
+            DEFAULT_CONFIG,
+        )
+        events: list[str] = []
+
+        def once(msg: str) -> None:
+            events.append(f"once:{msg}")
+            handle.off("stderr", once)
+
+        handle.on("stderr", once)
+        handle.on("stderr", lambda msg: events.append(f"always:{msg}"))
+        handle._emit("stderr", "a")
+        handle._emit("stderr", "b")
+        handle._emit("unregistered", "c")  # no handlers — no-op
+        assert events == ["once:a", "always:a", "always:b"]
+
 
 # ============================================================================
 # ContainerOptions validation tests
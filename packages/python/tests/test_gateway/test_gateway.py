@@ -228,6 +228,27 @@ async def test_load_trik_invalid_manifest():
             await gw.load_trik(trik_dir)
 
 
+@pytest.mark.asyncio
+async def test_load_trik_allowlist():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        allowed_dir = _create_trik_dir(tmpdir, "allowed-trik")
+        blocked_dir = _create_trik_dir(tmpdir, "blocked-trik")
+
+        gw = TrikGateway(TrikGatewayConfig(
+            allowed_triks=["allowed-trik"],
+            config_store=InMemoryConfigStore(),
+            storage_provider=InMemoryStorageProvider(),
+            session_storage=InMemorySessionStorage(),
+        ))
+        await gw.initialize()
+
+        await gw.load_trik(allowed_dir)
+        assert gw.is_loaded("local/allowed-trik")
+
+        with pytest.raises(ValueError, match="not in the allowlist"):
+            await gw.load_trik(blocked_dir)
+
+
 @pytest.mark.asyncio
 async def test_loaded_triks_query():
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -358,6 +379,61 @@ async def test_force_back():
         assert isinstance(result2, RouteToMain)
 
 
+@pytest.fixture
+def session_clock(monkeypatch):
+    """Controllable millisecond clock for session expiry."""
+    from trikhub.gateway import session_storage
+
+    now = [1_000_000]
+    monkeypatch.setattr(session_storage, "_now_ms", lambda: now[0])
+    monkeypatch.setattr(session_storage, "_monotonic_ms", lambda: now[0])
+    return now
+
+
+def _make_gateway_with_session_ttl(ttl_ms: int) -> TrikGateway:
+    return TrikGateway(TrikGatewayConfig(
+        config_store=InMemoryConfigStore(),
+        storage_provider=InMemoryStorageProvider(),
+        session_storage=InMemorySessionStorage(session_ttl_ms=ttl_ms),
+    ))
+
+
+@pytest.mark.asyncio
+async def test_force_back_after_session_expired(session_clock):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _create_trik_dir(tmpdir, "echo-trik")
+        gw = _make_gateway_with_session_ttl(1000)
+        await gw.initialize()
+        await gw.load_trik(os.path.join(tmpdir, "echo-trik"))
+
+        await gw.start_handoff("local/echo-trik", "Hello", "session-1")
+        session_clock[0] += 5000
+
+        result = await gw.route_message("/back", "session-1")
+        assert isinstance(result, RouteForceBack)
+        assert "no activity logged" in result.summary
+        assert gw.get_active_handoff() is None
+
+
+@pytest.mark.asyncio
+async def test_message_after_session_expired_ends_handoff(session_clock):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _create_trik_dir(tmpdir, "echo-trik")
+        gw = _make_gateway_with_session_ttl(1000)
+        await gw.initialize()
+        await gw.load_trik(os.path.join(tmpdir, "echo-trik"))
+
+        await gw.start_handoff("local/echo-trik", "Hello", "session-1")
+        session_clock[0] += 5000
+
+        result = await gw.route_message("still there?", "session-1")
+        assert isinstance(result, RouteTransferBack)
+        assert "session expired" in result.message
+        assert gw.get_active_handoff() is None
+
+        assert isinstance(await gw.route_message("hello", "session-1"), RouteToMain)
+
+
 @pytest.mark.asyncio
 async def test_max_turns():
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -435,6 +511,66 @@ async def test_execute_exposed_tool():
         assert "Found: Executed search" in output
 
 
+@pytest.mark.asyncio
+async def test_execute_exposed_tool_resolution_cached_per_load(monkeypatch):
+    resolve = TrikGateway._resolve_exposed_tool
+    calls: list[str] = []
+
+    def counting_resolve(trik_id, tool_name, loaded):
+        calls.append(tool_name)
+        return resolve(trik_id, tool_name, loaded)
+
+    monkeypatch.setattr(TrikGateway, "_resolve_exposed_tool", staticmethod(counting_resolve))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trik_dir = _create_trik_dir(tmpdir, "tool-trik", mode="tool", tools={
+            "search": {
+                "description": "Search",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {"q": {"type": "string"}},
+                    "required": ["q"],
+                },
+                "outputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "result": {"type": "string", "maxLength": 500, "pattern": ".*"},
+                    },
+                },
+                "outputTemplate": "Found: {{result}}",
+            }
+        })
+        gw = _make_gateway()
+        await gw.initialize()
+        await gw.load_trik(trik_dir)
+
+        await gw.execute_exposed_tool("local/tool-trik", "search", {"q": "a"})
+        await gw.execute_exposed_tool("local/tool-trik", "search", {"q": "b"})
+        assert calls == ["search"]
+        # The template is converted once, at resolution
+        tool = gw._triks["local/tool-trik"].exposed_tools["search"]
+        assert tool.output_format == "Found: {result}"
+
+        # Reloading replaces the loaded trik, and with it the resolved tools
+        gw.unload_trik("local/tool-trik")
+        await gw.load_trik(trik_dir)
+        await gw.execute_exposed_tool("local/tool-trik", "search", {"q": "c"})
+        assert calls == ["search", "search"]
+
+        with pytest.raises(ValueError, match="not found"):
+            await gw.execute_exposed_tool("local/tool-trik", "missing", {})
+
+
+def test_output_template_format_conversion():
+    from trikhub.gateway.gateway import _KeepPlaceholder, _to_format_template
+
+    fmt = _to_format_template("{json} {{a}}/{{b}} {{a}}")
+    assert fmt == "{{json}} {a}/{b} {a}"
+    assert fmt.format_map(_KeepPlaceholder(a=1)) == "{json} 1/{{b}} 1"
+    # Numeric field names would be positional in str.format — not converted
+    assert _to_format_template("Row {{0}}") is None
+
+
 # ============================================================================
 # Tests: Directory Loading
 # ============================================================================
@@ -454,6 +590,22 @@ async def test_load_from_directory():
         assert sorted(m.id for m in manifests) == ["trik-a", "trik-b"]
 
 
+@pytest.mark.asyncio
+async def test_load_from_directory_skips_non_trik_dirs(capfd):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _create_trik_dir(tmpdir, "trik-a")
+        os.makedirs(os.path.join(tmpdir, "not-a-trik"))
+        with open(os.path.join(tmpdir, "README.md"), "w") as f:
+            f.write("not a directory")
+
+        gw = _make_gateway()
+        await gw.initialize()
+        manifests = await gw.load_triks_from_directory(tmpdir)
+
+        assert [m.id for m in manifests] == ["trik-a"]
+        assert "Failed to load" not in capfd.readouterr().err
+
+
 @pytest.mark.asyncio
 async def test_load_from_scoped_directory():
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -533,6 +685,80 @@ async def test_load_from_config():
         assert manifests[0].id == "config-trik"
 
 
+@pytest.mark.asyncio
+async def test_load_from_config_scoped_and_missing(capfd):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trikhub_dir = os.path.join(tmpdir, ".trikhub")
+        scope_dir = os.path.join(trikhub_dir, "triks", "@acme")
+        _create_trik_dir(scope_dir, "scoped-trik")
+
+        config = {"triks": ["@acme/scoped-trik", "not-installed-trik"]}
+        config_path = os.path.join(trikhub_dir, "config.json")
+        with open(config_path, "w") as f:
+            json.dump(config, f)
+
+        from trikhub.gateway.gateway import LoadFromConfigOptions
+
+        gw = _make_gateway()
+        await gw.initialize()
+        manifests = await gw.load_triks_from_config(
+            LoadFromConfigOptions(config_path=config_path)
+        )
+
+        assert [m.id for m in manifests] == ["scoped-trik"]
+        assert gw.is_loaded("@acme/scoped-trik")
+        captured = capfd.readouterr()
+        assert "[TrikGateway] Failed to load not-installed-trik" in captured.err
+
+
+@pytest.mark.asyncio
+async def test_load_from_config_reports_directory_without_manifest(capfd):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trikhub_dir = os.path.join(tmpdir, ".trikhub")
+        os.makedirs(trikhub_dir)
+        empty_dir = os.path.join(tmpdir, "empty-trik")
+        os.makedirs(empty_dir)
+
+        config_path = os.path.join(trikhub_dir, "config.json")
+        with open(config_path, "w") as f:
+            json.dump({"triks": [empty_dir]}, f)
+
+        from trikhub.gateway.gateway import LoadFromConfigOptions
+
+        gw = _make_gateway()
+        await gw.initialize()
+        manifests = await gw.load_triks_from_config(
+            LoadFromConfigOptions(config_path=config_path)
+        )
+
+        assert manifests == []
+        captured = capfd.readouterr()
+        assert f"[TrikGateway] Failed to load {empty_dir}" in captured.err
+        assert "manifest.json" in captured.err
+        assert "Could not find trik" not in captured.err
+
+
+@pytest.mark.asyncio
+async def test_load_from_config_nested_name():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trikhub_dir = os.path.join(tmpdir, ".trikhub")
+        _create_trik_dir(os.path.join(trikhub_dir, "triks", "vendor"), "nested-trik")
+
+        config_path = os.path.join(trikhub_dir, "config.json")
+        with open(config_path, "w") as f:
+            json.dump({"triks": ["vendor/nested-trik"]}, f)
+
+        from trikhub.gateway.gateway import LoadFromConfigOptions
+
+        gw = _make_gateway()
+        await gw.initialize()
+        manifests = await gw.load_triks_from_config(
+            LoadFromConfigOptions(config_path=config_path, base_dir=trikhub_dir)
+        )
+
+        assert [m.id for m in manifests] == ["nested-trik"]
+
+
 @pytest.mark.asyncio
 async def test_load_from_config_missing_file():
     from trikhub.gateway.gateway import LoadFromConfigOptions
@@ -0,0 +1,268 @@
+"""Tests for NodeWorker stdout framing."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from trikhub.gateway.node_worker import _STREAM_LIMIT, NodeWorker, NodeWorkerConfig
+
+
+def _worker_reading(
+    *chunks: bytes, limit: int = _STREAM_LIMIT
+) -> tuple[NodeWorker, list[bytes]]:
+    reader = asyncio.StreamReader(limit=limit)
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+
+    worker = NodeWorker(NodeWorkerConfig(node_path="node"))
+    worker._process = SimpleNamespace(stdout=reader)  # type: ignore[assignment]
+    frames: list[bytes] = []
+
+    async def record(line: bytes) -> None:
+        frames.append(line)
+
+    worker._handle_line = record  # type: ignore[method-assign]
+    return worker, frames
+
+
+@pytest.mark.asyncio
+async def test_read_loop_splits_frames_across_chunks():
+    worker, frames = _worker_reading(b'{"a":1}\n{"b"', b':2}\n\n{"c":3}\r\n')
+    await worker._read_loop()
+    assert frames == [b'{"a":1}', b'{"b":2}', b'{"c":3}']
+
+
+@pytest.mark.asyncio
+async def test_read_loop_handles_frames_beyond_default_line_limit():
+    big = b'{"data":"' + b"x" * (256 * 1024) + b'"}'
+    worker, frames = _worker_reading(big + b"\n")
+    await worker._read_loop()
+    assert frames == [big]
+
+
+@pytest.mark.asyncio
+async def test_read_loop_drops_frame_over_limit_and_continues():
+    worker, frames = _worker_reading(
+        b'{"data":"' + b"x" * 100 + b'"}\n', b'{"ok":1}\n{"tail":2}', limit=32
+    )
+    errors: list[Exception] = []
+    worker.on("parse-error", lambda err, line: errors.append(err))
+    await worker._read_loop()
+    assert frames == [b'{"ok":1}', b'{"tail":2}']
+    assert len(errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_bad_json_emits_parse_error():
+    worker = NodeWorker(NodeWorkerConfig(node_path="node"))
+    errors: list[str] = []
+    worker.on("parse-error", lambda err, line: errors.append(line))
+    await worker._handle_line(b"not json")
+    assert errors == ["not json"]
+
+
+@pytest.mark.asyncio
+async def test_handle_line_routes_requests_and_responses():
+    worker = NodeWorker(NodeWorkerConfig(node_path="node"))
+    requests: list[dict] = []
+
+    async def record(msg):
+        requests.append(msg)
+
+    worker._handle_worker_request = record  # type: ignore[method-assign]
+    rejected: list[str] = []
+    worker.on("parse-error", lambda err, line: rejected.append(str(err)))
+    future = asyncio.get_running_loop().create_future()
+    worker._pending["7"] = future
+
+    await worker._handle_line(b'{"jsonrpc":"2.0","id":"s1","method":"storage.get","params":{}}')
+    await worker._handle_line(
+        b'{"jsonrpc":"2.0","id":"7","error":{"code":1001,"message":"missing"}}'
+    )
+    await worker._handle_line(b'{"jsonrpc":"1.0","id":"s2","method":"storage.get"}')
+    await worker._handle_line(b'{"jsonrpc":"2.0","id":7,"result":{}}')  # non-string id
+    await worker._handle_line(b'{"jsonrpc":"2.0","id":["7"],"result":{}}')  # unhashable
+
+    assert [m["id"] for m in requests] == ["s1"]
+    # Frames failing validation at the read boundary are reported, not routed
+    assert rejected == [
+        "Failed to parse JSON-RPC message: Invalid JSON-RPC version",
+        "Failed to parse JSON-RPC message: Message ID must be a string",
+        "Failed to parse JSON-RPC message: Message ID must be a string",
+    ]
+    resp = future.result()
+    assert resp.id == "7" and resp.result is None
+    assert (resp.error.code, resp.error.message) == (1001, "missing")
+    assert worker._pending == {}
+
+
+class _RecordingStdin:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[bytes]] = []
+        self.drains = 0
+        self.fail = fail
+
+    def writelines(self, frames):
+        self.batches.append(list(frames))
+
+    async def drain(self):
+        self.drains += 1
+        if self.fail:
+            raise ConnectionResetError("pipe closed")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_coalesce_into_one_flush():
+    worker = NodeWorker(NodeWorkerConfig(node_path="node"))
+    stdin = _RecordingStdin()
+    worker._process = SimpleNamespace(stdin=stdin)  # type: ignore[assignment]
+
+    await asyncio.gather(*(worker._write_frame(b"%d\n" % i) for i in range(3)))
+    await worker._write_frame(b"later\n")
+
+    assert stdin.batches == [[b"0\n", b"1\n", b"2\n"], [b"later\n"]]
+    assert stdin.drains == 2
+
+
+@pytest.mark.asyncio
+async def test_write_errors_reach_every_waiter():
+    worker = NodeWorker(NodeWorkerConfig(node_path="node"))
+    worker._process = SimpleNamespace(stdin=_RecordingStdin(fail=True))  # type: ignore[assignment]
+
+    results = await asyncio.gather(
+        worker._write_frame(b"a\n"), worker._write_frame(b"b\n"), return_exceptions=True
+    )
+    assert all(isinstance(r, ConnectionResetError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flush_fails_waiters_and_resets_batch():
+    worker = NodeWorker(NodeWorkerConfig(node_path="node"))
+    stdin = _RecordingStdin()
+    blocked = asyncio.Event()
+
+    async def drain_forever():
+        await blocked.wait()
+
+    stdin.drain = drain_forever  # type: ignore[method-assign]
+    worker._process = SimpleNamespace(stdin=stdin)  # type: ignore[assignment]
+
+    writes = [asyncio.ensure_future(worker._write_frame(b"%d\n" % i)) for i in range(2)]
+    await asyncio.sleep(0.01)
+    (flush,) = worker._flush_tasks  # held strongly while in flight
+    flush.cancel()
+
+    results = await asyncio.gather(*writes, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert worker._tx_batch is None
+    assert not worker._flush_tasks
+
+
+@pytest.mark.asyncio
+async def test_kill_discards_queued_batch():
+    worker = NodeWorker(NodeWorkerConfig(node_path="node"))
+    worker._process = SimpleNamespace(stdin=_RecordingStdin())  # type: ignore[assignment]
+    write = asyncio.ensure_future(worker._write_frame(b"x\n"))
+    await asyncio.sleep(0)
+    assert worker._tx_batch is not None
+
+    worker._process = None
+    worker.kill()
+    assert worker._tx_batch is None
+    await write
+
+
+@pytest.mark.asyncio
+async def test_timed_out_request_is_forgotten_and_late_response_ignored():
+    from trikhub.worker.protocol import create_request
+
+    worker = NodeWorker(NodeWorkerConfig(node_path="node"))
+    worker._process = SimpleNamespace(stdin=_RecordingStdin())  # type: ignore[assignment]
+    request = create_request("health")
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(worker._send_request(request), timeout=0.01)
+    assert worker._pending == {}
+
+    # Must not raise (it would end the read loop)
+    await worker._handle_line(
+        b'{"jsonrpc":"2.0","id":"%s","result":{}}' % request.id.encode()
+    )
+
+
+def test_pool_acquire_prefers_idle_workers_and_rotates():
+    from trikhub.gateway import NodeWorkerPool
+
+    pool = NodeWorkerPool(NodeWorkerConfig(node_path="node", pool_size=3))
+    a, b, c = pool.workers
+
+    # All idle: plain round-robin
+    assert [pool.acquire() for _ in range(4)] == [a, b, c, a]
+
+    a._pending["1"] = b._pending["2"] = b._pending["3"] = None  # type: ignore[assignment]
+    assert pool.acquire() is c
+    c._pending["4"] = c._pending["5"] = None  # type: ignore[assignment]
+    assert pool.acquire() is a
+
+
+@pytest.mark.asyncio
+async def test_pool_start_failure_kills_every_worker(monkeypatch):
+    from trikhub.gateway import NodeWorkerPool
+
+    pool = NodeWorkerPool(NodeWorkerConfig(node_path="node", pool_size=2))
+    good, bad = pool.workers
+    killed: list[NodeWorker] = []
+
+    async def ok() -> None:
+        good._is_ready = True
+
+    async def fail() -> None:
+        raise RuntimeError("spawn failed")
+
+    monkeypatch.setattr(good, "start", ok)
+    monkeypatch.setattr(bad, "start", fail)
+    for worker in pool.workers:
+        monkeypatch.setattr(worker, "kill", lambda w=worker: killed.append(w))
+
+    with pytest.raises(RuntimeError, match="spawn failed"):
+        await pool.start()
+    assert killed == [good, bad]
+
+
+def test_create_node_worker_picks_pool_by_size():
+    from trikhub.gateway import NodeWorkerPool, create_node_worker
+
+    assert type(create_node_worker(NodeWorkerConfig(node_path="node"))) is NodeWorker
+    pool = create_node_worker(NodeWorkerConfig(node_path="node", pool_size=2))
+    assert isinstance(pool, NodeWorkerPool)
+    assert len(pool.workers) == 2
+
+
+def test_node_path_detection_is_cached(monkeypatch):
+    from trikhub.gateway import node_worker
+
+    monkeypatch.delenv("TRIKHUB_NODE", raising=False)
+    monkeypatch.delenv("NODE_PATH_EXEC", raising=False)
+    node_worker._find_node_executable.cache_clear()
+    calls: list[str] = []
+    monkeypatch.setattr(node_worker.shutil, "which", lambda name: calls.append(name) or "/x/node")
+    try:
+        assert NodeWorkerConfig().node_path == "/x/node"
+        assert NodeWorkerConfig().node_path == "/x/node"
+        assert calls == ["node"]
+        # Explicit env overrides still apply per instance
+        monkeypatch.setenv("TRIKHUB_NODE", "/custom/node")
+        assert NodeWorkerConfig().node_path == "/custom/node"
+    finally:
+        node_worker._find_node_executable.cache_clear()
+
+
+def test_result_types_are_slotted():
+    from trikhub.gateway.node_worker import HealthResult, ProcessMessageResult
+
+    result = ProcessMessageResult(message="hi", transfer_back=False)
+    assert result.tool_calls is None
+    assert not hasattr(result, "__dict__")
+    assert HealthResult(status="ok", runtime="node").uptime is None
@@ -52,6 +52,20 @@ def test_append_log_not_found():
         storage.append_log("nonexistent", entry)
 
 
+def test_append_log_caps_entries():
+    storage = InMemorySessionStorage(max_log_entries=2)
+    session = storage.create_session("trik-1")
+
+    for i in range(4):
+        storage.append_log(
+            session.sessionId,
+            HandoffLogEntry(timestamp=i, type="tool_execution", summary=f"call {i}"),
+        )
+
+    log = storage.get_session(session.sessionId).log
+    assert [e.summary for e in log] == ["call 2", "call 3"]
+
+
 def test_close_session():
     storage = InMemorySessionStorage()
     session = storage.create_session("trik-1")
@@ -80,3 +94,115 @@ def test_multiple_sessions():
     assert s1.sessionId != s2.sessionId
     assert storage.get_session(s1.sessionId) is not None
     assert storage.get_session(s2.sessionId) is not None
+
+
+def test_session_ids_are_unique_uuid4():
+    import uuid
+
+    storage = InMemorySessionStorage()
+    ids = [storage.create_session("trik").sessionId for _ in range(100)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(uuid.UUID(i).version == 4 for i in ids)
+
+
+# ============================================================================
+# TTL eviction
+# ============================================================================
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable millisecond clock (wall and monotonic) for session_storage."""
+    from trikhub.gateway import session_storage
+
+    now = [1_000_000]
+    monkeypatch.setattr(session_storage, "_now_ms", lambda: now[0])
+    monkeypatch.setattr(session_storage, "_monotonic_ms", lambda: now[0])
+    return now
+
+
+def test_sessions_never_expire_without_ttl(clock):
+    storage = InMemorySessionStorage()
+    session = storage.create_session("trik-1")
+
+    clock[0] += 10**9
+    assert storage.get_session(session.sessionId) is not None
+    assert storage.cleanup() == 0
+
+
+def test_expired_session_not_returned(clock):
+    storage = InMemorySessionStorage(session_ttl_ms=1000)
+    session = storage.create_session("trik-1")
+
+    clock[0] += 1000
+    assert storage.get_session(session.sessionId) is None
+    assert session.sessionId not in storage._sessions  # evicted on read
+    assert storage.cleanup() == 0  # the sweep just drops the stale heap entry
+    with pytest.raises(ValueError, match="not found"):
+        storage.append_log(
+            session.sessionId,
+            HandoffLogEntry(timestamp=clock[0], type="handoff_end", summary="late"),
+        )
+
+
+def test_cleanup_removes_only_expired(clock):
+    storage = InMemorySessionStorage(session_ttl_ms=1000)
+    old = storage.create_session("trik-1")
+    clock[0] += 500
+    fresh = storage.create_session("trik-2")
+
+    clock[0] += 600
+    assert storage.cleanup() == 1
+    assert storage.get_session(old.sessionId) is None
+    assert storage.get_session(fresh.sessionId) is not None
+
+
+def test_cleanup_keeps_renewed_sessions(clock):
+    storage = InMemorySessionStorage(session_ttl_ms=1000)
+    session = storage.create_session("trik-1")
+
+    clock[0] += 900
+    storage.close_session(session.sessionId)  # activity renews the TTL
+    clock[0] += 900
+    assert storage.cleanup() == 0
+    assert storage.get_session(session.sessionId) is not None
+
+    clock[0] += 100
+    assert storage.cleanup() == 1
+
+
+def test_cleanup_drains_in_batches(clock):
+    storage = InMemorySessionStorage(session_ttl_ms=1000, cleanup_every=10_000)
+    for _ in range(5):
+        storage.create_session("trik")
+
+    clock[0] += 1000
+    assert storage.cleanup(max_batch=2) == 2
+    assert storage.cleanup(max_batch=2) == 2
+    assert storage.cleanup(max_batch=2) == 1
+    assert storage.cleanup(max_batch=2) == 0
+
+    for _ in range(3):
+        storage.create_session("trik")
+    clock[0] += 1000
+    assert storage.cleanup(max_batch=None) == 3
+
+
+def test_create_triggers_bounded_cleanup(clock):
+    storage = InMemorySessionStorage(session_ttl_ms=1000, cleanup_every=5, cleanup_batch_size=2)
+    for _ in range(4):
+        storage.create_session("old")
+
+    clock[0] += 1000
+    storage.create_session("new")  # 5th call — evicts at most 2 expired sessions
+    assert len(storage._sessions) == 3
+
+    for _ in range(5):
+        storage.create_session("new")  # 10th call — evicts the remaining 2
+    assert len(storage._sessions) == 6
+
+
+def test_cleanup_every_must_be_positive():
+    with pytest.raises(ValueError, match="cleanup_every"):
+        InMemorySessionStorage(session_ttl_ms=1000, cleanup_every=0)
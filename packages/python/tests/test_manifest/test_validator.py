@@ -4,6 +4,7 @@ import pytest
 from trikhub.manifest.validator import (
     ValidationResult,
     diagnose_error,
+    is_valid_data,
     validate_data,
     validate_manifest,
 )
@@ -632,3 +633,107 @@ class TestValidateData:
         }
         result = validate_data(schema, {})
         assert result.valid is False
+
+    def test_sees_schema_edited_in_place(self):
+        schema = {"type": "object", "required": ["name"]}
+        assert validate_data(schema, {}).valid is False
+        schema["required"] = []
+        assert validate_data(schema, {}).valid is True
+        assert is_valid_data(schema, {}) is True
+
+    def test_fast_path_disagreement_defers_to_full_validator(self, monkeypatch):
+        from trikhub.manifest import validator as mod
+
+        def rejects_everything(data):
+            raise ValueError("fast path failed")
+
+        monkeypatch.setattr(mod, "_compile_fast", lambda s: rejects_everything)
+        compiled = mod._compile_data_validator({"type": "object", "required": ["name"]})
+        # Fast check fails, Draft7Validator finds no errors -> still valid
+        assert compiled.validate({"name": "x"}).valid is True
+        assert compiled.is_valid({"name": "x"}) is True
+        assert compiled.validate({}).valid is False
+
+    def test_fast_validator_compiled_for_data_schema(self):
+        pytest.importorskip("fastjsonschema")
+        from trikhub.manifest.validator import _compile_data_validator
+
+        compiled = _compile_data_validator({"type": "object", "required": ["name"]})
+        assert compiled.fast is not None
+
+    def test_uncompilable_schema_falls_back_with_warning(self, caplog):
+        pytest.importorskip("fastjsonschema")
+        from trikhub.manifest.validator import _compile_fast
+
+        with caplog.at_level("WARNING", logger="trikhub.manifest.validator"):
+            assert _compile_fast({"type": "not-a-type"}) is None
+        assert "fastjsonschema cannot compile schema" in caplog.text
+
+    def test_divergent_keywords_skip_fast_path(self):
+        from trikhub.manifest.validator import _compile_fast
+
+        schema = {"type": "object", "properties": {"n": {"multipleOf": 0.1}}}
+        assert _compile_fast(schema) is None
+        assert validate_data(schema, {"n": 0.3}).valid is False
+        assert is_valid_data(schema, {"n": 0.3}) is False
+
+
+class TestIsValidData:
+    def test_matches_validate_data(self):
+        schema = {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+            "required": ["name", "age"],
+        }
+        for data in ({"name": "a", "age": 1}, {"name": 1}, {}, []):
+            assert is_valid_data(schema, data) is validate_data(schema, data).valid
+
+
+class TestManifestSchema:
+    def test_public_schema_stays_a_plain_dict(self):
+        import json
+
+        from trikhub.manifest.validator import MANIFEST_SCHEMA
+
+        assert isinstance(MANIFEST_SCHEMA, dict)
+        assert json.loads(json.dumps(MANIFEST_SCHEMA)) == MANIFEST_SCHEMA
+
+    def test_validators_use_a_private_snapshot(self):
+        from trikhub.manifest.validator import _SCHEMA_SNAPSHOT, MANIFEST_SCHEMA
+
+        assert _SCHEMA_SNAPSHOT == MANIFEST_SCHEMA
+        assert _SCHEMA_SNAPSHOT is not MANIFEST_SCHEMA
+        assert _SCHEMA_SNAPSHOT["properties"] is not MANIFEST_SCHEMA["properties"]
+
+    def test_rejects_unknown_tool_property(self):
+        manifest = make_tool_manifest()
+        manifest["tools"]["computeHash"]["bogus"] = 1
+        result = validate_manifest(manifest)
+        assert result.valid is False
+        assert any("Additional properties are not allowed" in e for e in result.errors)
+
+    def test_rejects_non_object_tool(self):
+        manifest = make_tool_manifest()
+        manifest["tools"]["broken"] = 5
+        result = validate_manifest(manifest)
+        assert result.valid is False
+        assert any(e.startswith("tools/broken:") for e in result.errors)
+
+    def test_fast_validator_compiles_when_available(self):
+        pytest.importorskip("fastjsonschema")
+        from trikhub.manifest.validator import _fast_manifest_validator
+
+        assert _fast_manifest_validator is not None
+
+
+class TestValidationResult:
+    def test_is_a_dataclass(self):
+        import dataclasses
+
+        result = validate_data({"type": "object", "required": ["name"]}, {})
+        assert dataclasses.asdict(result) == {
+            "valid": False,
+            "errors": ["root: 'name' is a required property"],
+            "warnings": None,
+        }
+        assert dataclasses.replace(result, valid=True).valid is True
@@ -1,5 +1,7 @@
 """Tests for the JSON-RPC protocol module."""
 
+import pytest
+
 from trikhub.worker.protocol import (
     ErrorCode,
     JsonRpcError,
@@ -74,9 +76,62 @@ def test_request_id_auto_generated():
     req1 = create_request("health")
     req2 = create_request("health")
     assert req1.id != req2.id
+    assert isinstance(req1.id, str) and req1.id
+    assert int(req2.id) > int(req1.id)
 
 
 def test_error_code_values():
     assert ErrorCode.PARSE_ERROR == -32700
     assert ErrorCode.TRIK_NOT_FOUND == 1001
     assert ErrorCode.STORAGE_ERROR == 1006
+
+
+def test_encode_message_frames():
+    from trikhub.worker.protocol import decode_message, encode_message
+
+    frame = encode_message(create_request("health", {"n": 1}).to_dict())
+    assert isinstance(frame, bytes) and frame.endswith(b"\n")
+    assert frame.count(b"\n") == 1
+    assert decode_message(frame)["params"] == {"n": 1}
+    # Payloads orjson rejects still serialize via the stdlib fallback
+    assert decode_message(encode_message({"big": 2**70}))["big"] == 2**70
+
+
+def test_health_request_frame_matches_serialized_request():
+    from trikhub.worker.protocol import decode_message, encode_health_request, encode_message
+
+    request = create_request("health", {})
+    frame = encode_health_request(request.id)
+    assert frame.endswith(b"\n") and frame.count(b"\n") == 1
+    assert decode_message(frame) == decode_message(encode_message(request.to_dict()))
+
+
+def test_decode_message_rejects_bad_json():
+    from trikhub.worker.protocol import decode_message
+
+    with pytest.raises(ValueError):
+        decode_message(b"{not json")
+
+
+def test_parse_message_validates_frames():
+    from trikhub.worker.protocol import parse_message
+
+    msg = parse_message(b'{"jsonrpc":"2.0","id":"1","method":"health"}')
+    assert msg == {"jsonrpc": "2.0", "id": "1", "method": "health"}
+
+    for bad, reason in [
+        ("not json", "Failed to parse JSON-RPC message"),
+        ("[1, 2]", "Message must be an object"),
+        ('{"jsonrpc":"1.0","id":"1","method":"x"}', "Invalid JSON-RPC version"),
+        ('{"jsonrpc":"2.0","method":"x"}', "Message ID must be a string"),
+        ('{"jsonrpc":"2.0","id":7,"result":null}', "Message ID must be a string"),
+    ]:
+        with pytest.raises(ValueError, match=reason):
+            parse_message(bad)
+
+
+def test_parse_error_object_defaults_to_internal_error():
+    err = parse_error_object({})
+    assert err.code == ErrorCode.INTERNAL_ERROR
+    assert type(err.code) is int
+    assert err.message == "Unknown error"
@@ -146,3 +146,58 @@ def test_default_entry_values(tmp_path):
     loader = TrikLoader()
     agent = loader.load(str(tmp_path))
     assert callable(getattr(agent, "process_message", None))
+
+
+def _write_standalone_trik(trik_dir: Path, reply: str) -> None:
+    trik_dir.mkdir()
+    manifest = {"schemaVersion": 2, "name": trik_dir.name}
+    (trik_dir / "manifest.json").write_text(json.dumps(manifest))
+    (trik_dir / "graph.py").write_text(
+        textwrap.dedent(f"""\
+        class _Agent:
+            reply = "{reply}"
+
+            async def process_message(self, message, context):
+                from trikhub.manifest import TrikResponse
+                return TrikResponse(message=self.reply, transferBack=False)
+
+        agent = _Agent()
+        """)
+    )
+
+
+def test_same_module_stem_does_not_collide(tmp_path):
+    _write_standalone_trik(tmp_path / "first", "first")
+    _write_standalone_trik(tmp_path / "second", "second")
+    loader = TrikLoader()
+    first = loader.load(str(tmp_path / "first"))
+    second = loader.load(str(tmp_path / "second"))
+    assert first.reply == "first"
+    assert second.reply == "second"
+
+
+def test_reload_reuses_unchanged_module(tmp_path):
+    """A fresh loader reuses the already-imported module while its file is unchanged."""
+    _write_standalone_trik(tmp_path / "cached", "cached")
+    agent1 = TrikLoader().load(str(tmp_path / "cached"))
+    agent2 = TrikLoader().load(str(tmp_path / "cached"))
+    assert agent1 is agent2
+
+
+def test_reload_picks_up_in_place_upgrade(tmp_path):
+    import os
+    import shutil
+
+    trik_dir = tmp_path / "upgraded"
+    _write_standalone_trik(trik_dir, "v1")
+    old = TrikLoader().load(str(trik_dir))
+
+    shutil.rmtree(trik_dir)
+    _write_standalone_trik(trik_dir, "v2")
+    graph = trik_dir / "graph.py"
+    st = graph.stat()
+    os.utime(graph, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    new = TrikLoader().load(str(trik_dir))
+    assert new is not old
+    assert new.reply == "v2"
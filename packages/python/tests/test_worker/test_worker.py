@@ -45,12 +45,16 @@ def worker():
     """Create a PythonWorker and capture its stdout writes."""
     w = PythonWorker()
     w._output_lines = []
-    original_write_line = w._write_line
 
     def capture_write(line):
         w._output_lines.append(line)
 
+    def capture_frame(frame):
+        assert frame.endswith(b"\n") and frame.count(b"\n") == 1
+        w._output_lines.append(frame.decode("utf-8"))
+
     w._write_line = capture_write
+    w._write_frame = capture_frame
     return w
 
 
@@ -256,6 +260,15 @@ async def test_handle_message_invalid_jsonrpc(worker):
     assert resp["error"]["code"] == ErrorCode.INVALID_REQUEST
 
 
+async def test_handle_message_rejects_non_string_id(worker):
+    await worker._handle_message(json.dumps({"jsonrpc": "2.0", "id": 3, "method": "health"}))
+    assert len(worker._output_lines) == 1
+    resp = json.loads(worker._output_lines[0])
+    assert resp["id"] == "unknown"
+    assert resp["error"]["code"] == ErrorCode.INVALID_REQUEST
+    assert "Message ID must be a string" in resp["error"]["message"]
+
+
 async def test_handle_message_routes_request(worker):
     msg = json.dumps({"jsonrpc": "2.0", "id": "r1", "method": "health"})
     await worker._handle_message(msg)
@@ -34,7 +34,7 @@ def get_registry_url() -> str:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TrikVersion:
     version: str
     git_tag: str
@@ -44,7 +44,7 @@ class TrikVersion:
     manifest: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrikInfo:
     full_name: str
     scope: str
@@ -63,7 +63,7 @@ class TrikInfo:
     runtime: str = "node"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     total: int
     page: int
@@ -25,6 +25,8 @@ from trikhub.gateway.config_store import (
 from trikhub.gateway.node_worker import (
     NodeWorker,
     NodeWorkerConfig,
+    NodeWorkerPool,
+    create_node_worker,
 )
 from trikhub.gateway.container_manager import (
     ContainerWorkerHandle,
@@ -67,6 +69,8 @@ __all__ = [
     # Node worker
     "NodeWorker",
     "NodeWorkerConfig",
+    "NodeWorkerPool",
+    "create_node_worker",
     # Container manager
     "ContainerWorkerHandle",
     "ContainerOptions",
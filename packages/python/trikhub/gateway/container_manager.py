@@ -17,7 +17,6 @@ from __future__ import annotations
 
 import atexit
 import asyncio
-import json
 import os
 import re
 import shutil
@@ -28,13 +27,13 @@ from typing import Any, Callable
 
 from trikhub.worker.protocol import (
     ErrorCode,
-    JsonRpcError,
     JsonRpcRequest,
     JsonRpcResponse,
     create_request,
+    encode_message,
     error_response,
-    is_request,
-    is_response,
+    parse_error_object,
+    parse_message,
     success_response,
 )
 from trikhub.manifest import TrikStorageContext
@@ -79,7 +78,7 @@ class ContainerManagerConfig:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthResult:
     status: str
     runtime: str
@@ -87,14 +86,14 @@ class HealthResult:
     uptime: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessMessageResult:
     message: str
     transfer_back: bool
     tool_calls: list[dict[str, Any]] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecuteToolResult:
     output: dict[str, Any]
 
@@ -104,7 +103,7 @@ class ExecuteToolResult:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class _PendingRequest:
     future: asyncio.Future[JsonRpcResponse]
     timeout_task: asyncio.Task[None] | None = None
@@ -504,35 +503,33 @@ class ContainerWorkerHandle:
             print(f"[Container:{self._trik_id}:recv] {line}")
 
         try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            self._emit("parse-error", ValueError(f"Bad JSON: {line}"), line)
+            msg = parse_message(line)
+        except ValueError as exc:
+            self._emit("parse-error", exc, line)
             return
 
-        if not isinstance(msg, dict) or msg.get("jsonrpc") != "2.0":
+        # One key test classifies the frame: requests carry a method, anything
+        # else is a response to one of ours
+        if "method" in msg:
+            await self._handle_worker_request(msg)
             return
 
-        if is_response(msg):
-            resp = JsonRpcResponse(
-                id=msg["id"],
+        request_id: str = msg["id"]  # parse_message() guarantees a string id
+        pending = self._pending.pop(request_id, None)
+        if pending is None:
+            return
+        if pending.timeout_task:
+            pending.timeout_task.cancel()
+        if pending.future.done():
+            return
+        err = msg.get("error")
+        pending.future.set_result(
+            JsonRpcResponse(
+                id=request_id,
                 result=msg.get("result"),
-                error=(
-                    JsonRpcError(
-                        code=msg["error"].get("code", ErrorCode.INTERNAL_ERROR),
-                        message=msg["error"].get("message", "Unknown error"),
-                        data=msg["error"].get("data"),
-                    )
-                    if msg.get("error")
-                    else None
-                ),
+                error=parse_error_object(err) if err else None,
             )
-            pending = self._pending.pop(resp.id, None)
-            if pending:
-                if pending.timeout_task:
-                    pending.timeout_task.cancel()
-                pending.future.set_result(resp)
-        elif is_request(msg):
-            await self._handle_worker_request(msg)
+        )
 
     async def _handle_worker_request(self, msg: dict[str, Any]) -> None:
         method = msg.get("method", "")
@@ -622,26 +619,30 @@ class ContainerWorkerHandle:
         async with self._write_lock:
             if not self._process or not self._process.stdin:
                 return
-            line = json.dumps(request.to_dict()) + "\n"
+            frame = encode_message(request.to_dict())
             if self._config.debug:
-                print(f"[Container:{self._trik_id}:send] {line.strip()}")
-            self._process.stdin.write(line.encode("utf-8"))
+                print(f"[Container:{self._trik_id}:send] {frame.decode('utf-8').strip()}")
+            self._process.stdin.write(frame)
             await self._process.stdin.drain()
 
     async def _write_response(self, response: JsonRpcResponse) -> None:
         async with self._write_lock:
             if not self._process or not self._process.stdin:
                 return
-            line = json.dumps(response.to_dict()) + "\n"
+            frame = encode_message(response.to_dict())
             if self._config.debug:
-                print(f"[Container:{self._trik_id}:send] {line.strip()}")
-            self._process.stdin.write(line.encode("utf-8"))
+                print(f"[Container:{self._trik_id}:send] {frame.decode('utf-8').strip()}")
+            self._process.stdin.write(frame)
             await self._process.stdin.drain()
 
     # -- Events ---------------------------------------------------------------
 
     def _emit(self, event: str, *args: Any) -> None:
-        for handler in self._event_handlers.get(event, []):
+        handlers = self._event_handlers.get(event)
+        if not handlers:
+            return
+        # Snapshot so a handler calling on()/off() doesn't skip its neighbours
+        for handler in tuple(handlers):
             try:
                 handler(*args)
             except Exception:
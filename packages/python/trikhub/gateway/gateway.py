@@ -12,9 +12,10 @@ from __future__ import annotations
 import importlib.util
 import json
 import os
+import re
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -32,9 +33,9 @@ from trikhub.manifest import (
     TrikResponse,
     TrikRuntime,
     ToolExecutionResult,
-    validate_data,
     validate_manifest,
 )
+from trikhub.manifest.validator import _compile_data_validator, _DataValidator
 from trikhub.worker.trik_loader import TrikLoader
 
 from trikhub.gateway.config_store import ConfigStore, FileConfigStore, InMemoryConfigStore
@@ -44,18 +45,80 @@ from trikhub.gateway.container_manager import (
     ContainerWorkerHandle,
     DockerContainerManager,
 )
-from trikhub.gateway.node_worker import NodeWorker, NodeWorkerConfig
+from trikhub.gateway.node_worker import (
+    NodeWorker,
+    NodeWorkerConfig,
+    NodeWorkerPool,
+    create_node_worker,
+)
 from trikhub.gateway.session_storage import InMemorySessionStorage, SessionStorage
 from trikhub.gateway.storage_provider import InMemoryStorageProvider, SqliteStorageProvider, StorageProvider
 from trikhub.gateway.registry_provider import GatewayRegistryProvider
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover — optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+# Tools used internally by the handoff protocol — hidden from progress events
+_INTERNAL_TOOLS = frozenset({"transfer_back"})
+
+# {{field}} placeholders in outputTemplate / logTemplate
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+class _KeepPlaceholder(dict[str, Any]):
+    """format_map() mapping that leaves unknown fields as their {{field}} source."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> str:
+        return "{{" + key + "}}"
+
+
+def _to_format_template(template: str) -> str | None:
+    """
+    Convert a {{field}} template to str.format syntax.
+
+    Literal braces are escaped. Returns None when a field name is not a
+    valid identifier (e.g. {{0}}), which str.format would treat as a
+    positional index — callers fall back to regex substitution.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    out: list[str] = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            if not part.isidentifier():
+                return None
+            out.append("{" + part + "}")
+        else:
+            out.append(part.replace("{", "{{").replace("}", "}}"))
+    return "".join(out)
+
+
+# Control characters except newline (\n=0x0A) and tab (\t=0x09)
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
+
 
 # ============================================================================
 # Types
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
+class _ExposedTool:
+    """Everything execute_exposed_tool() needs for one tool, resolved once."""
+
+    input_validator: _DataValidator
+    output_validator: _DataValidator
+    output_props: tuple[str, ...]
+    output_template: str
+    # output_template in str.format syntax, or None to fill it by regex
+    output_format: str | None
+
+
+@dataclass(slots=True)
 class _LoadedTrik:
     manifest: TrikManifest
     agent: Any  # TrikAgent (Protocol) — may be proxy for JS triks
@@ -63,6 +126,25 @@ class _LoadedTrik:
     runtime: TrikRuntime
     containerized: bool = False
     scoped_name: str = ""
+    # Capability flags resolved once at load time (read on every turn)
+    storage_enabled: bool = field(init=False, default=False)
+    expose_capabilities: bool = field(init=False, default=False)
+    registry_enabled: bool = field(init=False, default=False)
+    # Tool-mode tools resolved on first call (compiled schemas + template)
+    exposed_tools: dict[str, _ExposedTool] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        caps = self.manifest.capabilities
+        if caps is None:
+            return
+        trik_mgmt_enabled = bool(caps.trikManagement and caps.trikManagement.enabled)
+        self.storage_enabled = bool(caps.storage and caps.storage.enabled)
+        self.expose_capabilities = bool(
+            (caps.filesystem and caps.filesystem.enabled)
+            or (caps.shell and caps.shell.enabled)
+            or trik_mgmt_enabled
+        )
+        self.registry_enabled = trik_mgmt_enabled
 
 
 @dataclass
@@ -167,7 +249,7 @@ class ExposedToolDefinition:
     output_template: str
 
 
-@dataclass
+@dataclass(slots=True)
 class _ActiveHandoff:
     trik_id: str
     session_id: str
@@ -212,8 +294,11 @@ class TrikGateway:
         self._storage_provider: StorageProvider = cfg.storage_provider or SqliteStorageProvider()
         self._session_storage: SessionStorage = cfg.session_storage or InMemorySessionStorage()
         self._max_turns = cfg.max_turns_per_handoff
+        self._allowed_triks: frozenset[str] | None = (
+            frozenset(cfg.allowed_triks) if cfg.allowed_triks else None
+        )
         self._config_loaded = False
-        self._node_worker: NodeWorker | None = None
+        self._node_worker: NodeWorker | NodeWorkerPool | None = None
         self._container_manager: DockerContainerManager | None = None
         self._trik_loader = TrikLoader()
         self._triks: dict[str, _LoadedTrik] = {}
@@ -367,18 +452,20 @@ class TrikGateway:
         loaded = self._triks.get(trik_id)
         if loaded is None:
             raise ValueError(f'Trik "{trik_id}" is not loaded')
-        if loaded.manifest.agent.mode != "tool":
-            raise ValueError(f'Trik "{trik_id}" is not a tool-mode trik')
-
-        decl = (loaded.manifest.tools or {}).get(tool_name)
-        if not decl or not decl.inputSchema or not decl.outputSchema or not decl.outputTemplate:
-            raise ValueError(f'Tool "{tool_name}" not found in trik "{trik_id}"')
 
-        # Validate input
-        input_validation = validate_data(decl.inputSchema.model_dump(by_alias=True, exclude_none=True), input)
-        if not input_validation.valid:
+        # One lookup on the hot path; the cache lives on the _LoadedTrik, so a
+        # reload or unload of the trik drops it along with the old manifest.
+        try:
+            tool = loaded.exposed_tools[tool_name]
+        except KeyError:
+            tool = self._resolve_exposed_tool(trik_id, tool_name, loaded)
+            loaded.exposed_tools[tool_name] = tool
+
+        # Validate input (errors are only collected once the check has failed)
+        if not tool.input_validator.is_valid(input):
+            errors = tool.input_validator.validate(input).errors or []
             raise ValueError(
-                f"Invalid input for {trik_id}.{tool_name}: {', '.join(input_validation.errors or [])}"
+                f"Invalid input for {trik_id}.{tool_name}: {', '.join(errors)}"
             )
 
         agent = loaded.agent
@@ -389,31 +476,53 @@ class TrikGateway:
         result: ToolExecutionResult = await agent.execute_tool(tool_name, input, ctx)
 
         # Validate output
-        output_validation = validate_data(
-            decl.outputSchema.model_dump(by_alias=True, exclude_none=True), result.output
-        )
-        if not output_validation.valid:
+        if not tool.output_validator.is_valid(result.output):
+            errors = tool.output_validator.validate(result.output).errors or []
             raise ValueError(
-                f'Tool "{tool_name}" returned invalid output: {", ".join(output_validation.errors or [])}'
+                f'Tool "{tool_name}" returned invalid output: {", ".join(errors)}'
             )
 
-        # Strip to declared properties
-        declared_props = list(
-            (decl.outputSchema.properties or {}).keys()
+        # Strip to declared properties; None values are left out so their
+        # placeholders stay unfilled
+        output = result.output
+        stripped = _KeepPlaceholder(
+            (k, output[k]) for k in tool.output_props if output.get(k) is not None
         )
-        stripped: dict[str, Any] = {k: result.output[k] for k in declared_props if k in result.output}
 
         # Fill outputTemplate
-        import re
+        if tool.output_format is not None:
+            return tool.output_format.format_map(stripped)
 
         def _replace(m: re.Match[str]) -> str:
-            field = m.group(1)
-            val = stripped.get(field)
-            if val is None:
-                return m.group(0)
-            return str(val)
+            val = stripped.get(m.group(1))
+            return m.group(0) if val is None else str(val)
+
+        return _PLACEHOLDER_RE.sub(_replace, tool.output_template)
+
+    @staticmethod
+    def _resolve_exposed_tool(
+        trik_id: str, tool_name: str, loaded: _LoadedTrik
+    ) -> _ExposedTool:
+        if loaded.manifest.agent.mode != "tool":
+            raise ValueError(f'Trik "{trik_id}" is not a tool-mode trik')
 
-        return re.sub(r"\{\{(\w+)\}\}", _replace, decl.outputTemplate)
+        decl = (loaded.manifest.tools or {}).get(tool_name)
+        if not decl or not decl.inputSchema or not decl.outputSchema or not decl.outputTemplate:
+            raise ValueError(f'Tool "{tool_name}" not found in trik "{trik_id}"')
+
+        return _ExposedTool(
+            # The dumped schemas are private to these validators, so they are
+            # never mutated and can be compiled once
+            input_validator=_compile_data_validator(
+                decl.inputSchema.model_dump(by_alias=True, exclude_none=True)
+            ),
+            output_validator=_compile_data_validator(
+                decl.outputSchema.model_dump(by_alias=True, exclude_none=True)
+            ),
+            output_props=tuple(decl.outputSchema.properties or {}),
+            output_template=decl.outputTemplate,
+            output_format=_to_format_template(decl.outputTemplate),
+        )
 
     # -- Internal Routing -----------------------------------------------------
 
@@ -422,28 +531,40 @@ class TrikGateway:
     ) -> RouteToTrik | RouteTransferBack:
         handoff = self._active_handoff
         assert handoff is not None
-        loaded = self._triks[handoff.trik_id]
+        # Bind hot attributes to locals — this runs on every handoff turn
+        trik_id = handoff.trik_id
+        handoff_session_id = handoff.session_id
+        loaded = self._triks[trik_id]
+        manifest = loaded.manifest
+        trik_name = manifest.name
+        emit = self._emit
+
+        if self._session_storage.get_session(handoff_session_id) is None:
+            # The session expired (session_ttl_ms) while the handoff was idle
+            return await self._auto_transfer_back(
+                "Handoff session expired. Automatically transferring back.",
+                transfer_reason="session_expired",
+            )
 
-        ctx = self._build_trik_context(handoff.session_id, loaded)
+        ctx = self._build_trik_context(handoff_session_id, loaded)
 
         # Inject progress callback for real-time tool visibility
-        internal_tools = {"transfer_back"}
         def on_progress(event):
             tool_name = event.get("toolName", "")
-            if tool_name in internal_tools:
+            if tool_name in _INTERNAL_TOOLS:
                 return
             event_type = event.get("type", "")
             payload = {
-                "trikId": handoff.trik_id,
-                "trikName": loaded.manifest.name,
+                "trikId": trik_id,
+                "trikName": trik_name,
                 "toolName": tool_name,
             }
             if event_type == "tool_start":
-                self._emit("handoff:tool_start", payload)
+                emit("handoff:tool_start", payload)
             elif event_type == "tool_end":
-                self._emit("handoff:tool_end", payload)
+                emit("handoff:tool_end", payload)
             elif event_type == "tool_error":
-                self._emit("handoff:tool_error", payload)
+                emit("handoff:tool_error", payload)
 
         ctx.on_progress = on_progress
 
@@ -456,14 +577,14 @@ class TrikGateway:
             )
 
         if loaded.containerized:
-            self._emit("handoff:container_start", {
-                "trikId": handoff.trik_id,
-                "trikName": loaded.manifest.name,
+            emit("handoff:container_start", {
+                "trikId": trik_id,
+                "trikName": trik_name,
             })
 
-        self._emit("handoff:thinking", {
-            "trikId": handoff.trik_id,
-            "trikName": loaded.manifest.name,
+        emit("handoff:thinking", {
+            "trikId": trik_id,
+            "trikName": trik_name,
         })
 
         try:
@@ -472,62 +593,55 @@ class TrikGateway:
             # User-facing: include sanitized error for debugging
             sanitized = self._sanitize_error_message(str(exc))
 
-            self._emit("handoff:error", {
-                "trikId": handoff.trik_id,
-                "trikName": loaded.manifest.name,
+            emit("handoff:error", {
+                "trikId": trik_id,
+                "trikName": trik_name,
                 "error": sanitized,
             })
 
-            user_message = f'Trik "{loaded.manifest.name}" encountered an error: {sanitized}'
+            user_message = f'Trik "{trik_name}" encountered an error: {sanitized}'
             # Agent-facing log: generic message, no trik-controlled text
-            agent_log = f'Trik "{loaded.manifest.name}" encountered an error and transferred back'
+            agent_log = f'Trik "{trik_name}" encountered an error and transferred back'
             return await self._auto_transfer_back(user_message, log_summary=agent_log, transfer_reason="error")
 
-        self._emit("handoff:message", {
-            "trikId": handoff.trik_id,
-            "trikName": loaded.manifest.name,
+        emit("handoff:message", {
+            "trikId": trik_id,
+            "trikName": trik_name,
             "direction": "from_trik",
         })
 
         if response.toolCalls:
-            self._process_tool_calls(handoff.session_id, loaded.manifest, response.toolCalls)
+            self._process_tool_calls(handoff_session_id, manifest, response.toolCalls)
 
         if response.transferBack:
-            self._session_storage.append_log(
-                handoff.session_id,
-                HandoffLogEntry(
-                    timestamp=_now_ms(),
-                    type="handoff_end",
-                    summary=f"Transferred back from {loaded.manifest.name}",
-                ),
-            )
-            summary = self._build_session_summary(handoff.session_id, loaded.manifest)
+            self._log_handoff_end(handoff_session_id, f"Transferred back from {trik_name}")
+            summary = self._build_session_summary(handoff_session_id, manifest)
 
-            self._emit("handoff:summary", {
-                "trikId": handoff.trik_id,
-                "trikName": loaded.manifest.name,
-                "sessionId": handoff.session_id,
+            emit("handoff:summary", {
+                "trikId": trik_id,
+                "trikName": trik_name,
+                "sessionId": handoff_session_id,
             })
 
-            self._emit("handoff:transfer_back", {
-                "trikId": handoff.trik_id,
-                "trikName": loaded.manifest.name,
+            emit("handoff:transfer_back", {
+                "trikId": trik_id,
+                "trikName": trik_name,
                 "reason": "voluntary",
             })
 
             result = RouteTransferBack(
-                trik_id=handoff.trik_id,
+                trik_id=trik_id,
                 message=response.message,
                 summary=summary,
-                session_id=handoff.session_id,
+                session_id=handoff_session_id,
             )
             self._active_handoff = None
             return result
 
         return RouteToTrik(
-            trik_id=handoff.trik_id,
+            trik_id=trik_id,
             response=response,
-            session_id=handoff.session_id,
+            session_id=handoff_session_id,
         )
 
     async def _force_transfer_back(self) -> RouteForceBack:
@@ -535,14 +649,7 @@ class TrikGateway:
         assert handoff is not None
         loaded = self._triks[handoff.trik_id]
 
-        self._session_storage.append_log(
-            handoff.session_id,
-            HandoffLogEntry(
-                timestamp=_now_ms(),
-                type="handoff_end",
-                summary="Force transfer-back via /back",
-            ),
-        )
+        self._log_handoff_end(handoff.session_id, "Force transfer-back via /back")
         summary = self._build_session_summary(handoff.session_id, loaded.manifest)
 
         self._emit("handoff:summary", {
@@ -572,9 +679,7 @@ class TrikGateway:
         Sanitize an error message for safe display.
         Strips control characters (keeps newlines/tabs) and truncates.
         """
-        import re
-        # Strip control characters except newline (\n=0x0A) and tab (\t=0x09)
-        cleaned = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", msg)
+        cleaned = _CONTROL_CHARS_RE.sub("", msg)
         if len(cleaned) <= max_length:
             return cleaned
         return cleaned[:max_length] + "..."
@@ -590,13 +695,8 @@ class TrikGateway:
         loaded = self._triks[handoff.trik_id]
 
         # Log handoff end — use log_summary for the agent-facing log if provided
-        self._session_storage.append_log(
-            handoff.session_id,
-            HandoffLogEntry(
-                timestamp=_now_ms(),
-                type="handoff_end",
-                summary=log_summary if log_summary is not None else reason,
-            ),
+        self._log_handoff_end(
+            handoff.session_id, log_summary if log_summary is not None else reason
         )
         summary = self._build_session_summary(handoff.session_id, loaded.manifest)
 
@@ -623,6 +723,16 @@ class TrikGateway:
 
     # -- Conversation Log -----------------------------------------------------
 
+    def _log_handoff_end(self, session_id: str, summary: str) -> None:
+        # A session that expired mid-handoff has no log left to write to, and
+        # must not stop the handoff from ending
+        if self._session_storage.get_session(session_id) is None:
+            return
+        self._session_storage.append_log(
+            session_id,
+            HandoffLogEntry(timestamp=_now_ms(), type="handoff_end", summary=summary),
+        )
+
     def _process_tool_calls(
         self,
         session_id: str,
@@ -674,8 +784,7 @@ class TrikGateway:
 
             # Pattern — reject if no match
             if field_schema.pattern:
-                import re as _re
-                if not _re.search(field_schema.pattern, value):
+                if not re.search(field_schema.pattern, value):
                     return None
 
             # maxLength — truncate
@@ -704,7 +813,6 @@ class TrikGateway:
         """
         if not decl or not decl.logTemplate:
             return f"Called {call.tool}"
-        import re
 
         log_schema = decl.logSchema
 
@@ -719,7 +827,7 @@ class TrikGateway:
             validated = TrikGateway._validate_log_value(val, log_schema[field])
             return validated if validated is not None else m.group(0)
 
-        return re.sub(r"\{\{(\w+)\}\}", _replace, decl.logTemplate)
+        return _PLACEHOLDER_RE.sub(_replace, decl.logTemplate)
 
     def _build_session_summary(self, session_id: str, manifest: TrikManifest) -> str:
         session = self._session_storage.get_session(session_id)
@@ -736,36 +844,21 @@ class TrikGateway:
 
     def _build_trik_context(self, session_id: str, loaded: _LoadedTrik) -> TrikContext:
         config_ctx = self._config_store.get_for_trik(loaded.scoped_name)
-        storage_enabled = (
-            loaded.manifest.capabilities
-            and loaded.manifest.capabilities.storage
-            and loaded.manifest.capabilities.storage.enabled
-        )
+        caps = loaded.manifest.capabilities
         storage_ctx = (
-            self._storage_provider.for_trik(
-                loaded.scoped_name,
-                loaded.manifest.capabilities.storage if loaded.manifest.capabilities else None,
-            )
-            if storage_enabled
+            self._storage_provider.for_trik(loaded.scoped_name, caps.storage if caps else None)
+            if loaded.storage_enabled
             else self._create_noop_storage()
         )
         ctx = TrikContext(sessionId=session_id, config=config_ctx, storage=storage_ctx)
 
         # Include capabilities if the trik declares filesystem/shell/trikManagement
-        if loaded.manifest.capabilities:
-            caps = loaded.manifest.capabilities
-            trik_mgmt = caps.trikManagement
-            if (
-                (caps.filesystem and caps.filesystem.enabled)
-                or (caps.shell and caps.shell.enabled)
-                or (trik_mgmt and trik_mgmt.enabled)
-            ):
-                ctx.capabilities = caps
+        if loaded.expose_capabilities:
+            ctx.capabilities = caps
 
         # Inject registry context if trikManagement declared
-        if loaded.manifest.capabilities and loaded.manifest.capabilities.trikManagement:
-            if loaded.manifest.capabilities.trikManagement.enabled:
-                ctx.registry = self._registry_provider
+        if loaded.registry_enabled:
+            ctx.registry = self._registry_provider
 
         return ctx
 
@@ -814,8 +907,7 @@ class TrikGateway:
 
     async def load_trik(self, trik_path: str, scoped_name: str | None = None) -> TrikManifest:
         manifest_path = os.path.join(trik_path, "manifest.json")
-        with open(manifest_path) as f:
-            manifest_data = json.load(f)
+        manifest_data = _read_json(manifest_path)
 
         validation = validate_manifest(manifest_data)
         if not validation.valid:
@@ -828,9 +920,9 @@ class TrikGateway:
         # Determine scoped name for resource isolation
         resolved_scoped_name = scoped_name or self._resolve_scoped_name(trik_path, manifest)
 
-        if self._config.allowed_triks and (
-            resolved_scoped_name not in self._config.allowed_triks
-            and manifest.id not in self._config.allowed_triks
+        allowed = self._allowed_triks
+        if allowed is not None and (
+            resolved_scoped_name not in allowed and manifest.id not in allowed
         ):
             raise ValueError(f'Trik "{manifest.id}" ({resolved_scoped_name}) is not in the allowlist')
 
@@ -853,6 +945,7 @@ class TrikGateway:
                 f'"{manifest.id}" at {trik_path} conflicts with already-loaded trik'
             )
 
+        # TrikEntry.runtime is already validated to a TrikRuntime member by pydantic
         runtime = manifest.entry.runtime or TrikRuntime.NODE
         is_tool_mode = manifest.agent.mode == "tool"
         containerized = self._needs_containerization(manifest)
@@ -862,10 +955,10 @@ class TrikGateway:
             agent = self._create_container_agent_proxy(manifest, trik_path, runtime, resolved_scoped_name)
             self._triks[resolved_scoped_name] = _LoadedTrik(
                 manifest=manifest, agent=agent, path=trik_path,
-                runtime=runtime if isinstance(runtime, TrikRuntime) else TrikRuntime(runtime),
+                runtime=runtime,
                 containerized=True, scoped_name=resolved_scoped_name,
             )
-        elif runtime == TrikRuntime.PYTHON or runtime == "python":
+        elif runtime is TrikRuntime.PYTHON:
             # Load Python triks in-process
             agent = self._trik_loader.load(trik_path)
             self._triks[resolved_scoped_name] = _LoadedTrik(
@@ -1059,15 +1152,14 @@ class TrikGateway:
                     )
 
                     # Rewrite container-internal port references to actual host ports
-                    import re as _re
                     response_message = result.message
                     for cport in expose_ports:
                         hport = handle.get_host_port(cport)
                         if hport and hport != cport:
-                            response_message = _re.sub(
+                            response_message = re.sub(
                                 rf"localhost:{cport}\b", f"localhost:{hport}", response_message
                             )
-                            response_message = _re.sub(
+                            response_message = re.sub(
                                 rf"127\.0\.0\.1:{cport}\b", f"127.0.0.1:{hport}", response_message
                             )
 
@@ -1129,11 +1221,19 @@ class TrikGateway:
         return self._container_manager
 
     async def _ensure_node_worker(self) -> NodeWorker:
+        """
+        Start the Node worker (or pool) if needed and return the worker the
+        next call should go to — pooled calls are pinned to one process so
+        its storage context is set on the worker that runs them.
+        """
         if self._node_worker is None:
-            self._node_worker = NodeWorker(self._config.node_worker_config)
-        if not self._node_worker.ready:
-            await self._node_worker.start()
-        return self._node_worker
+            self._node_worker = create_node_worker(self._config.node_worker_config)
+        worker = self._node_worker
+        if not worker.ready:
+            await worker.start()
+        if isinstance(worker, NodeWorkerPool):
+            return worker.acquire()
+        return worker
 
     async def shutdown(self) -> None:
         if self._node_worker:
@@ -1158,36 +1258,31 @@ class TrikGateway:
         if not os.path.isdir(resolved):
             return manifests
 
-        for entry in os.listdir(resolved):
-            entry_path = os.path.join(resolved, entry)
-            if not os.path.isdir(entry_path):
-                continue
+        async def _try_load(trik_path: str) -> None:
+            try:
+                manifests.append(await self.load_trik(trik_path))
+            except FileNotFoundError as e:
+                # No manifest.json — not a trik directory, skip silently
+                if e.filename != os.path.join(trik_path, "manifest.json"):
+                    errors.append((trik_path, str(e)))
+            except Exception as e:
+                errors.append((trik_path, str(e)))
+
+        with os.scandir(resolved) as it:
+            entries = [e for e in it if e.is_dir()]
 
-            if entry.startswith("@"):
+        for entry in entries:
+            if entry.name.startswith("@"):
                 # Scoped directory
-                for scoped in os.listdir(entry_path):
-                    scoped_path = os.path.join(entry_path, scoped)
-                    if not os.path.isdir(scoped_path):
-                        continue
-                    mp = os.path.join(scoped_path, "manifest.json")
-                    if os.path.isfile(mp):
-                        try:
-                            m = await self.load_trik(scoped_path)
-                            manifests.append(m)
-                        except Exception as e:
-                            errors.append((scoped_path, str(e)))
+                with os.scandir(entry.path) as scoped_it:
+                    scoped_entries = [e for e in scoped_it if e.is_dir()]
+                for scoped in scoped_entries:
+                    await _try_load(scoped.path)
             else:
-                mp = os.path.join(entry_path, "manifest.json")
-                if os.path.isfile(mp):
-                    try:
-                        m = await self.load_trik(entry_path)
-                        manifests.append(m)
-                    except Exception as e:
-                        errors.append((entry_path, str(e)))
+                await _try_load(entry.path)
 
         if errors:
-            for path, err in errors:
-                print(f"[TrikGateway] Failed to load {path}: {err}", file=sys.stderr)
+            _write_load_errors(errors)
 
         return manifests
 
@@ -1207,8 +1302,7 @@ class TrikGateway:
             return []
 
         try:
-            with open(config_path) as f:
-                config_data = json.load(f)
+            config_data = _read_json(config_path)
         except Exception as e:
             raise ValueError(f'Failed to read config file "{config_path}": {e}')
 
@@ -1217,17 +1311,31 @@ class TrikGateway:
 
         manifests: list[TrikManifest] = []
         errors: list[tuple[str, str]] = []
+        triks_root = os.path.join(base_dir, "triks")
+        installed: set[str] | None = None  # scanned lazily, once per call
 
         for trik_name in config_data["triks"]:
             try:
-                # 1. Check if it's a direct path
-                if os.path.isdir(trik_name):
+                # 1. Try it as a direct path — a missing manifest means "not a path",
+                # unless the directory exists, in which case the trik is broken
+                try:
                     manifests.append(await self.load_trik(trik_name, trik_name))
                     continue
-
-                # 2. Check in .trikhub/triks/ directory
-                triks_dir = os.path.join(base_dir, "triks", trik_name)
-                if os.path.isdir(triks_dir):
+                except (FileNotFoundError, NotADirectoryError) as e:
+                    if e.filename != os.path.join(trik_name, "manifest.json"):
+                        raise
+                    if os.path.isdir(trik_name):
+                        raise
+
+                # 2. Check in .trikhub/triks/ directory. The scan lists name and
+                # @scope/name; deeper paths are checked on their own.
+                if installed is None:
+                    installed = _scan_trik_dirs(triks_root)
+                triks_dir = os.path.join(triks_root, trik_name)
+                scan_depth = 1 if trik_name.startswith("@") else 0
+                if trik_name in installed or (
+                    trik_name.count("/") > scan_depth and os.path.isdir(triks_dir)
+                ):
                     manifests.append(await self.load_trik(triks_dir, trik_name))
                     continue
 
@@ -1261,8 +1369,7 @@ class TrikGateway:
                 errors.append((trik_name, str(e)))
 
         if errors:
-            for trik_name, err in errors:
-                print(f"[TrikGateway] Failed to load {trik_name}: {err}", file=sys.stderr)
+            _write_load_errors(errors)
 
         return manifests
 
@@ -1305,6 +1412,47 @@ class TrikGateway:
 # ============================================================================
 
 
+def _read_json(path: str) -> Any:
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _scan_trik_dirs(triks_root: str) -> set[str]:
+    """
+    List trik directories under triks_root as ``name`` / ``@scope/name``.
+
+    Uses one scandir per directory so membership checks need no extra stat calls.
+    """
+    names: set[str] = set()
+    try:
+        with os.scandir(triks_root) as it:
+            entries = [e for e in it if e.is_dir()]
+    except OSError:
+        return names
+
+    for entry in entries:
+        if not entry.name.startswith("@"):
+            names.add(entry.name)
+            continue
+        try:
+            with os.scandir(entry.path) as scoped:
+                names.update(f"{entry.name}/{s.name}" for s in scoped if s.is_dir())
+        except OSError:
+            continue
+    return names
+
+
+def _write_load_errors(errors: list[tuple[str, str]]) -> None:
+    """Report trik load failures to stderr in a single write."""
+    sys.stderr.write(
+        "".join(f"[TrikGateway] Failed to load {name}: {err}\n" for name, err in errors)
+    )
+
+
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
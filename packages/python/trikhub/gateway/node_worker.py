@@ -15,21 +15,23 @@ Mirrors packages/js/gateway/src/python-worker.ts (but in reverse).
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import shutil
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable
 
 from trikhub.worker.protocol import (
     ErrorCode,
-    JsonRpcError,
     JsonRpcRequest,
     JsonRpcResponse,
     create_request,
+    encode_health_request,
+    encode_message,
     error_response,
-    is_request,
-    is_response,
+    next_request_id,
+    parse_error_object,
+    parse_message,
     success_response,
 )
 from trikhub.manifest import TrikStorageContext
@@ -40,6 +42,7 @@ from trikhub.manifest import TrikStorageContext
 # ============================================================================
 
 
+@lru_cache(maxsize=1)
 def _find_node_executable() -> str:
     """
     Find the Node.js executable.
@@ -48,6 +51,9 @@ def _find_node_executable() -> str:
     1. PATH via shutil.which
     2. NVM directories (~/.nvm/versions/node/*/bin/node)
     3. Common install locations (/usr/local/bin/node, /opt/homebrew/bin/node)
+
+    The result is cached for the life of the process — every NodeWorkerConfig()
+    without an explicit node_path would otherwise repeat the PATH/NVM scan.
     """
     node = shutil.which("node")
     if node:
@@ -84,6 +90,9 @@ class NodeWorkerConfig:
     invoke_timeout_ms: int = 60000
     debug: bool = False
     worker_script_path: str | None = None
+    # Number of Node.js processes behind the gateway. 1 keeps a single
+    # NodeWorker; more spawns a NodeWorkerPool.
+    pool_size: int = 1
 
     def __post_init__(self) -> None:
         if self.node_path is None:
@@ -100,7 +109,7 @@ class NodeWorkerConfig:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthResult:
     status: str
     runtime: str
@@ -108,14 +117,14 @@ class HealthResult:
     uptime: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessMessageResult:
     message: str
     transfer_back: bool
     tool_calls: list[dict[str, Any]] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecuteToolResult:
     output: dict[str, Any]
 
@@ -124,11 +133,19 @@ class ExecuteToolResult:
 # Node Worker
 # ============================================================================
 
+# StreamReader buffer limit for the worker's pipes. A single JSON-RPC frame
+# (one line) may be up to this size; the asyncio default is only 64 KiB.
+_STREAM_LIMIT = 16 * 1024 * 1024
 
-@dataclass
-class _PendingRequest:
-    future: asyncio.Future[JsonRpcResponse]
-    timeout_task: asyncio.Task[None] | None = None
+
+@dataclass(slots=True)
+class _TxBatch:
+    done: asyncio.Future[None]
+    frames: list[bytes] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # Mark a flush error as retrieved even if every waiter was cancelled
+        self.done.add_done_callback(lambda f: f.cancelled() or f.exception())
 
 
 class NodeWorker:
@@ -141,11 +158,15 @@ class NodeWorker:
     def __init__(self, config: NodeWorkerConfig | None = None) -> None:
         self._config = config or NodeWorkerConfig()
         self._process: asyncio.subprocess.Process | None = None
-        self._pending: dict[str, _PendingRequest] = {}
+        # Request id -> future awaiting the worker's response
+        self._pending: dict[str, asyncio.Future[JsonRpcResponse]] = {}
         self._is_ready = False
         self._startup_promise: asyncio.Task[None] | None = None
         self._read_task: asyncio.Task[None] | None = None
         self._write_lock = asyncio.Lock()
+        self._tx_batch: _TxBatch | None = None
+        # Strong refs to in-flight flush tasks (the loop only keeps weak ones)
+        self._flush_tasks: set[asyncio.Task[None]] = set()
         self._storage_context: TrikStorageContext | None = None
         self._event_handlers: dict[str, list[Callable[..., Any]]] = {}
         self._stderr_buffer: list[str] = []
@@ -166,7 +187,10 @@ class NodeWorker:
         await self._startup_promise
 
     async def _do_start(self) -> None:
-        worker_script = self._find_worker_script()
+        # The script lookup stats several paths and scans PATH (twice when it
+        # falls back to npx); keep that off the event loop, which may be serving
+        # other workers of a pool while this one starts.
+        worker_script = await asyncio.to_thread(self._find_worker_script)
 
         if worker_script.startswith("npx:"):
             package = worker_script[4:]
@@ -183,6 +207,7 @@ class NodeWorker:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             env={**os.environ, "NODE_NO_WARNINGS": "1"},
+            limit=_STREAM_LIMIT,
         )
 
         self._read_task = asyncio.create_task(self._read_loop())
@@ -260,17 +285,17 @@ class NodeWorker:
             self._is_ready = False
 
         self._stderr_buffer.clear()
+        # Frames queued for the old process must not ride along to a new one
+        self._tx_batch = None
 
         if self._read_task:
             self._read_task.cancel()
             self._read_task = None
 
-        for rid, pending in list(self._pending.items()):
-            if pending.timeout_task:
-                pending.timeout_task.cancel()
-            if not pending.future.done():
-                pending.future.set_exception(RuntimeError("Worker killed"))
-            del self._pending[rid]
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError("Worker killed"))
 
     # -- Public API -----------------------------------------------------------
 
@@ -373,21 +398,43 @@ class NodeWorker:
     async def _read_loop(self) -> None:
         if not self._process or not self._process.stdout:
             return
+        stdout = self._process.stdout
         try:
             while True:
-                line = await self._process.stdout.readline()
-                if not line:
+                try:
+                    line = await stdout.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    # EOF — deliver a final unterminated frame, if any
+                    line = e.partial
+                    if line.strip():
+                        await self._handle_line(line.strip())
                     break
-                line_str = line.decode("utf-8").strip()
-                if not line_str:
+                except asyncio.LimitOverrunError:
+                    await self._discard_oversized_frame(stdout)
                     continue
-                await self._handle_line(line_str)
+                line = line.strip()
+                if line:
+                    await self._handle_line(line)
         except asyncio.CancelledError:
             pass
         except Exception as e:
             if self._config.debug:
                 print(f"[NodeWorker] Read error: {e}")
 
+    async def _discard_oversized_frame(self, stdout: asyncio.StreamReader) -> None:
+        """Skip a frame longer than the reader limit instead of wedging the loop."""
+        while True:
+            try:
+                await stdout.readuntil(b"\n")
+                break
+            except asyncio.LimitOverrunError as e:
+                await stdout.readexactly(e.consumed)
+        self._emit(
+            "parse-error",
+            ValueError("Frame exceeds the stdout stream limit; dropped"),
+            "",
+        )
+
     async def _read_stderr(self) -> None:
         if not self._process or not self._process.stderr:
             return
@@ -404,40 +451,35 @@ class NodeWorker:
         except (asyncio.CancelledError, Exception):
             pass
 
-    async def _handle_line(self, line: str) -> None:
+    async def _handle_line(self, line: bytes) -> None:
         if self._config.debug:
-            print(f"[NodeWorker:recv] {line}")
+            print(f"[NodeWorker:recv] {line.decode('utf-8', 'replace')}")
 
         try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            self._emit("parse-error", ValueError(f"Bad JSON: {line}"), line)
+            msg = parse_message(line)
+        except ValueError as exc:
+            self._emit("parse-error", exc, line.decode("utf-8", "replace"))
             return
 
-        if not isinstance(msg, dict) or msg.get("jsonrpc") != "2.0":
+        # One key test classifies the frame: requests carry a method, anything
+        # else is a response to one of ours
+        if "method" in msg:
+            await self._handle_worker_request(msg)
             return
 
-        if is_response(msg):
-            resp = JsonRpcResponse(
-                id=msg["id"],
+        request_id: str = msg["id"]  # parse_message() guarantees a string id
+        future = self._pending.pop(request_id, None)
+        # Late replies (timed out, cancelled) are dropped before building anything
+        if future is None or future.done():
+            return
+        err = msg.get("error")
+        future.set_result(
+            JsonRpcResponse(
+                id=request_id,
                 result=msg.get("result"),
-                error=(
-                    JsonRpcError(
-                        code=msg["error"].get("code", ErrorCode.INTERNAL_ERROR),
-                        message=msg["error"].get("message", "Unknown error"),
-                        data=msg["error"].get("data"),
-                    )
-                    if msg.get("error")
-                    else None
-                ),
+                error=parse_error_object(err) if err else None,
             )
-            pending = self._pending.pop(resp.id, None)
-            if pending:
-                if pending.timeout_task:
-                    pending.timeout_task.cancel()
-                pending.future.set_result(resp)
-        elif is_request(msg):
-            await self._handle_worker_request(msg)
+        )
 
     async def _handle_worker_request(self, msg: dict[str, Any]) -> None:
         method = msg.get("method", "")
@@ -501,8 +543,8 @@ class NodeWorker:
             await self._write_response(resp)
 
     async def _check_health_internal(self) -> HealthResult:
-        req = create_request("health", {})
-        resp = await self._send_request(req)
+        request_id = next_request_id()
+        resp = await self._send_frame(request_id, encode_health_request(request_id))
         if resp.error is not None:
             raise RuntimeError(f"Health check failed: {resp.error.message}")
         r = resp.result or {}
@@ -514,39 +556,75 @@ class NodeWorker:
         )
 
     async def _send_request(self, request: JsonRpcRequest) -> JsonRpcResponse:
+        return await self._send_frame(request.id, encode_message(request.to_dict()))
+
+    async def _send_frame(self, request_id: str, frame: bytes) -> JsonRpcResponse:
+        """Send an already-encoded request frame and wait for its response."""
         if not self._process or not self._process.stdin:
             raise RuntimeError("Worker stdin not available")
 
         future: asyncio.Future[JsonRpcResponse] = asyncio.get_running_loop().create_future()
-        self._pending[request.id] = _PendingRequest(future=future)
+        self._pending[request_id] = future
+        try:
+            await self._write_frame(frame)
+            return await future
+        finally:
+            # Timed out, cancelled or failed to write: drop the entry so it
+            # doesn't leak and a late response is simply ignored
+            self._pending.pop(request_id, None)
 
-        await self._write_request(request)
-        return await future
+    async def _write_response(self, response: JsonRpcResponse) -> None:
+        await self._write_frame(encode_message(response.to_dict()))
 
-    async def _write_request(self, request: JsonRpcRequest) -> None:
-        async with self._write_lock:
-            if not self._process or not self._process.stdin:
-                return
-            line = json.dumps(request.to_dict()) + "\n"
-            if self._config.debug:
-                print(f"[NodeWorker:send] {line.strip()}")
-            self._process.stdin.write(line.encode("utf-8"))
-            await self._process.stdin.drain()
+    async def _write_frame(self, frame: bytes) -> None:
+        """
+        Queue a frame on the current write batch and wait until it is flushed.
 
-    async def _write_response(self, response: JsonRpcResponse) -> None:
-        async with self._write_lock:
-            if not self._process or not self._process.stdin:
-                return
-            line = json.dumps(response.to_dict()) + "\n"
-            if self._config.debug:
-                print(f"[NodeWorker:send] {line.strip()}")
-            self._process.stdin.write(line.encode("utf-8"))
-            await self._process.stdin.drain()
+        Frames queued before the batch's flush runs (the rest of this loop tick,
+        plus anything queued while the previous batch is draining) go out in a
+        single writelines() + drain().
+        """
+        if self._config.debug:
+            print(f"[NodeWorker:send] {frame.decode('utf-8').strip()}")
+        batch = self._tx_batch
+        if batch is None:
+            batch = self._tx_batch = _TxBatch(asyncio.get_running_loop().create_future())
+            task = asyncio.create_task(self._flush_batch(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        batch.frames.append(frame)
+        # Shielded: a cancelled caller must not cancel the flush for the others
+        await asyncio.shield(batch.done)
+
+    async def _flush_batch(self, batch: _TxBatch) -> None:
+        try:
+            await asyncio.sleep(0)  # let the rest of this tick's writers join
+            async with self._write_lock:
+                if self._tx_batch is batch:
+                    self._tx_batch = None
+                if self._process and self._process.stdin:
+                    self._process.stdin.writelines(batch.frames)
+                    await self._process.stdin.drain()
+        except Exception as e:
+            batch.done.set_exception(e)
+        else:
+            batch.done.set_result(None)
+        finally:
+            # Cancelled mid-flush: fail the waiters rather than leave them hanging,
+            # and make sure later writers start a fresh batch
+            if self._tx_batch is batch:
+                self._tx_batch = None
+            if not batch.done.done():
+                batch.done.set_exception(RuntimeError("Write to worker was cancelled"))
 
     # -- Events ---------------------------------------------------------------
 
     def _emit(self, event: str, *args: Any) -> None:
-        for handler in self._event_handlers.get(event, []):
+        handlers = self._event_handlers.get(event)
+        if not handlers:
+            return
+        # Snapshot so a handler calling on()/off() doesn't skip its neighbours
+        for handler in tuple(handlers):
             try:
                 handler(*args)
             except Exception:
@@ -561,3 +639,114 @@ class NodeWorker:
             handlers.remove(handler)
         except ValueError:
             pass
+
+
+# ============================================================================
+# Worker pool
+# ============================================================================
+
+
+class NodeWorkerPool:
+    """
+    A fixed set of NodeWorker processes presenting the NodeWorker API.
+
+    Each call goes to the worker with the fewest requests in flight (ties rotate
+    round-robin), so independent invocations run in parallel Node processes
+    instead of queueing on one. Use acquire() to pin a call to one worker —
+    e.g. to set its storage context for the duration of that call.
+    """
+
+    def __init__(self, config: NodeWorkerConfig | None = None) -> None:
+        self._config = config or NodeWorkerConfig()
+        size = max(1, self._config.pool_size)
+        self._workers = [NodeWorker(self._config) for _ in range(size)]
+        self._next = 0
+        self._startup_promise: asyncio.Task[None] | None = None
+
+    @property
+    def workers(self) -> tuple[NodeWorker, ...]:
+        return tuple(self._workers)
+
+    @property
+    def ready(self) -> bool:
+        return all(w.ready for w in self._workers)
+
+    # -- Lifecycle ------------------------------------------------------------
+
+    async def start(self) -> None:
+        if self._startup_promise is None or self._startup_promise.done():
+            self._startup_promise = asyncio.create_task(self._do_start())
+        await self._startup_promise
+
+    async def _do_start(self) -> None:
+        results = await asyncio.gather(
+            *(w.start() for w in self._workers if not w.ready),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            self.kill()
+            raise errors[0]
+
+    async def shutdown(self, grace_period_ms: int = 5000) -> None:
+        await asyncio.gather(*(w.shutdown(grace_period_ms) for w in self._workers))
+
+    def kill(self) -> None:
+        for worker in self._workers:
+            worker.kill()
+
+    # -- Dispatch -------------------------------------------------------------
+
+    def acquire(self) -> NodeWorker:
+        """Pick the least-loaded worker, rotating the starting point on ties."""
+        workers = self._workers
+        n = len(workers)
+        start = self._next
+        self._next = (start + 1) % n
+        best = workers[start]
+        best_load = len(best._pending)
+        for i in range(1, n):
+            if not best_load:
+                break
+            worker = workers[(start + i) % n]
+            load = len(worker._pending)
+            if load < best_load:
+                best, best_load = worker, load
+        return best
+
+    # -- Public API -----------------------------------------------------------
+
+    def set_storage_context(self, ctx: TrikStorageContext | None) -> None:
+        for worker in self._workers:
+            worker.set_storage_context(ctx)
+
+    async def health(self) -> HealthResult:
+        """Check every worker; returns the first unhealthy result, else the first."""
+        results = await asyncio.gather(*(w.health() for w in self._workers))
+        for result in results:
+            if result.status != "ok":
+                return result
+        return results[0]
+
+    async def process_message(self, **kwargs: Any) -> ProcessMessageResult:
+        return await self.acquire().process_message(**kwargs)
+
+    async def execute_tool(self, **kwargs: Any) -> ExecuteToolResult:
+        return await self.acquire().execute_tool(**kwargs)
+
+    # -- Events ---------------------------------------------------------------
+
+    def on(self, event: str, handler: Callable[..., Any]) -> None:
+        for worker in self._workers:
+            worker.on(event, handler)
+
+    def off(self, event: str, handler: Callable[..., Any]) -> None:
+        for worker in self._workers:
+            worker.off(event, handler)
+
+
+def create_node_worker(config: NodeWorkerConfig | None = None) -> NodeWorker | NodeWorkerPool:
+    """A NodeWorker, or a NodeWorkerPool when config.pool_size is above 1."""
+    if config is not None and config.pool_size > 1:
+        return NodeWorkerPool(config)
+    return NodeWorker(config)
@@ -6,8 +6,10 @@ Mirrors packages/js/gateway/src/session-storage.ts
 
 from __future__ import annotations
 
+import heapq
 import time
 import uuid
+from dataclasses import dataclass
 from typing import Protocol
 
 from trikhub.manifest import HandoffLogEntry, HandoffSession
@@ -22,17 +24,48 @@ class SessionStorage(Protocol):
     def close_session(self, session_id: str) -> None: ...
 
 
+@dataclass(slots=True)
+class _Entry:
+    """A stored session plus its eviction deadline (None when no TTL is set)."""
+
+    session: HandoffSession
+    expires_at: int | None
+
+
 class InMemorySessionStorage:
     """
     In-memory session storage.
     Sessions are lost on process restart — suitable for development and testing.
+
+    If session_ttl_ms is set, sessions idle for longer than that are treated as
+    gone and are evicted by cleanup(). Every cleanup_every create/append calls,
+    up to cleanup_batch_size expired sessions are also evicted inline, so memory
+    stays bounded without an external sweeper.
+
+    If max_log_entries is set, each session keeps only its most recent log entries.
     """
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, HandoffSession] = {}
+    def __init__(
+        self,
+        session_ttl_ms: int | None = None,
+        cleanup_every: int = 50,
+        cleanup_batch_size: int = 8,
+        max_log_entries: int | None = None,
+    ) -> None:
+        if cleanup_every < 1:
+            raise ValueError(f"cleanup_every must be at least 1, got {cleanup_every}")
+        self._sessions: dict[str, _Entry] = {}
+        self._session_ttl_ms = session_ttl_ms
+        self._max_log_entries = max_log_entries
+        self._cleanup_every = cleanup_every
+        self._cleanup_batch_size = cleanup_batch_size
+        self._op_counter = 0
+        # Min-heap of (expires_at, session_id). Entries may be stale when a
+        # session saw activity after being pushed; cleanup() re-checks them.
+        self._expiry_heap: list[tuple[int, str]] = []
 
     def create_session(self, trik_id: str) -> HandoffSession:
-        now = int(time.time() * 1000)
+        now = _now_ms()
         session = HandoffSession(
             sessionId=str(uuid.uuid4()),
             trikId=trik_id,
@@ -40,21 +73,109 @@ class InMemorySessionStorage:
             createdAt=now,
             lastActivityAt=now,
         )
-        self._sessions[session.sessionId] = session
+        ttl = self._session_ttl_ms
+        if ttl is None:
+            self._sessions[session.sessionId] = _Entry(session, None)
+        else:
+            expires_at = _monotonic_ms() + ttl
+            self._sessions[session.sessionId] = _Entry(session, expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, session.sessionId))
+            self._maybe_cleanup()
         return session
 
     def get_session(self, session_id: str) -> HandoffSession | None:
-        return self._sessions.get(session_id)
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        # Only read the clock when the entry can expire at all
+        expires_at = entry.expires_at
+        if expires_at is not None and expires_at <= _monotonic_ms():
+            # Evict now rather than waiting for a sweep; the heap drops the
+            # stale id when it reaches it
+            self._sessions.pop(session_id, None)
+            return None
+        return entry.session
 
     def append_log(self, session_id: str, entry: HandoffLogEntry) -> None:
-        session = self._sessions.get(session_id)
-        if session is None:
-            raise ValueError(f'Session "{session_id}" not found')
-        session.log.append(entry)
-        session.lastActivityAt = int(time.time() * 1000)
+        stored = self._touch(session_id)
+        log = stored.session.log
+        log.append(entry)
+        max_entries = self._max_log_entries
+        if max_entries is not None and len(log) > max_entries:
+            # Trim in place — no new list, no rebinding on the pydantic model
+            del log[: len(log) - max_entries]
+        if self._session_ttl_ms is not None:
+            self._maybe_cleanup()
 
     def close_session(self, session_id: str) -> None:
-        session = self._sessions.get(session_id)
-        if session is None:
+        self._touch(session_id)
+
+    def cleanup(self, max_batch: int | None = 128) -> int:
+        """
+        Evict up to max_batch sessions that have been idle past the TTL
+        (all of them if max_batch is None). Returns the number removed — call
+        again until it returns 0 to drain a large backlog in bounded steps.
+        """
+        return self._evict_expired(max_batch)
+
+    def _maybe_cleanup(self) -> None:
+        """Amortized sweep: every cleanup_every calls, evict a small batch."""
+        self._op_counter += 1
+        if self._op_counter % self._cleanup_every == 0:
+            self._evict_expired(self._cleanup_batch_size)
+
+    def _evict_expired(self, max_remove: int | None = None) -> int:
+        if self._session_ttl_ms is None:
+            return 0
+
+        now = _monotonic_ms()
+        heap = self._expiry_heap
+        sessions = self._sessions
+        removed = 0
+        while heap and heap[0][0] <= now and (max_remove is None or removed < max_remove):
+            session_id = heap[0][1]
+            entry = sessions.get(session_id)
+            if entry is not None and not _is_expired(entry, now):
+                # Renewed by activity since it was pushed — requeue at its new
+                # expiry in place (one sift instead of pop + push)
+                expires_at = entry.expires_at
+                assert expires_at is not None  # entries in the heap always carry a TTL
+                heapq.heapreplace(heap, (expires_at, session_id))
+                continue
+            heapq.heappop(heap)
+            if entry is not None:
+                del sessions[session_id]
+                removed += 1
+        return removed
+
+    def _touch(self, session_id: str) -> _Entry:
+        """
+        Look up a live session and record activity on it in a single dict
+        lookup. Raises if the session does not exist or has expired.
+        """
+        entry = self._sessions.get(session_id)
+        if entry is None:
             raise ValueError(f'Session "{session_id}" not found')
-        session.lastActivityAt = int(time.time() * 1000)
+        ttl = self._session_ttl_ms
+        if ttl is not None:
+            now = _monotonic_ms()
+            if _is_expired(entry, now):
+                self._sessions.pop(session_id, None)
+                raise ValueError(f'Session "{session_id}" not found')
+            entry.expires_at = now + ttl
+        entry.session.lastActivityAt = _now_ms()
+        return entry
+
+
+def _is_expired(entry: _Entry, now: int) -> bool:
+    return entry.expires_at is not None and entry.expires_at <= now
+
+
+def _now_ms() -> int:
+    """Wall-clock milliseconds, for the session's public timestamps."""
+    return int(time.time() * 1000)
+
+
+def _monotonic_ms() -> int:
+    """Monotonic milliseconds for TTL deadlines — immune to system clock changes."""
+    return time.monotonic_ns() // 1_000_000
@@ -58,6 +58,7 @@ from trikhub.manifest.validator import (
     validate_manifest,
     diagnose_error,
     validate_data,
+    is_valid_data,
 )
 
 __all__ = [
@@ -111,4 +112,5 @@ __all__ = [
     "validate_manifest",
     "diagnose_error",
     "validate_data",
+    "is_valid_data",
 ]
@@ -8,19 +8,29 @@ Two-level validation mirroring packages/js/manifest/src/validator.ts:
 
 from __future__ import annotations
 
+import copy
+import logging
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
 from jsonschema import Draft7Validator
 
+try:
+    import fastjsonschema  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover — optional speedup
+    fastjsonschema = None
+
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Validation Result Types
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation operation."""
 
@@ -187,7 +197,63 @@ MANIFEST_SCHEMA: dict[str, Any] = {
     "additionalProperties": False,
 }
 
-_compiled_manifest_validator = Draft7Validator(MANIFEST_SCHEMA)
+
+# Private copy the validators below are compiled from, so later edits to the
+# public MANIFEST_SCHEMA dict cannot leave them out of sync
+_SCHEMA_SNAPSHOT: dict[str, Any] = copy.deepcopy(MANIFEST_SCHEMA)
+
+_compiled_manifest_validator = Draft7Validator(_SCHEMA_SNAPSHOT)
+
+
+# Keywords fastjsonschema evaluates differently from jsonschema (e.g. it accepts
+# 0.3 as a multipleOf 0.1). Schemas using them are validated by jsonschema only.
+_FAST_DIVERGENT_KEYWORDS = frozenset({"multipleOf"})
+
+
+def _uses_keywords(node: Any, keywords: frozenset[str]) -> bool:
+    if isinstance(node, dict):
+        return any(k in keywords or _uses_keywords(v, keywords) for k, v in node.items())
+    if isinstance(node, list):
+        return any(_uses_keywords(v, keywords) for v in node)
+    return False
+
+
+def _compile_fast(schema: dict[str, Any]) -> Callable[[Any], Any] | None:
+    """
+    Compile a schema with fastjsonschema when it is installed.
+
+    A fast accept is final, so the result must match Draft7Validator's; the
+    latter only enumerates errors once the fast check has failed. Returns None
+    when fastjsonschema is unavailable, cannot compile the schema, or the schema
+    uses a keyword the two engines disagree on.
+    """
+    if fastjsonschema is None or _uses_keywords(schema, _FAST_DIVERGENT_KEYWORDS):
+        return None
+    try:
+        # No default-filling (would mutate the data) and no format checks,
+        # matching Draft7Validator without a format checker
+        compiled: Callable[[Any], Any] = fastjsonschema.compile(
+            schema, use_default=False, use_formats=False
+        )
+    except fastjsonschema.JsonSchemaDefinitionException as exc:
+        logger.warning("fastjsonschema cannot compile schema, using jsonschema only: %s", exc)
+        return None
+    return compiled
+
+
+_fast_manifest_validator = _compile_fast(_SCHEMA_SNAPSHOT)
+
+
+def _fast_is_valid(fast: Callable[[Any], Any] | None, data: Any) -> bool:
+    if fast is None:
+        return False
+    try:
+        fast(data)
+    except Exception:
+        # JsonSchemaException, or anything the generated code trips over —
+        # the full validator decides
+        return False
+    return True
 
 
 # ============================================================================
@@ -212,9 +278,12 @@ GENERIC_DOMAIN_TAGS = frozenset([
 # ============================================================================
 
 
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
 def _extract_placeholders(template: str) -> list[str]:
     """Extract {{placeholder}} names from a template string."""
-    return re.findall(r"\{\{(\w+)\}\}", template)
+    return _PLACEHOLDER_RE.findall(template)
 
 
 def _is_constrained_type(schema: dict[str, Any]) -> bool:
@@ -263,7 +332,7 @@ def _is_agent_safe_type(schema: dict[str, Any]) -> bool:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class _SemanticIssue:
     type: str  # "error" or "warning"
     message: str
@@ -483,12 +552,10 @@ def validate_manifest(manifest: Any) -> ValidationResult:
     2. Semantic validation (mode consistency, log templates, constrained strings)
     """
     # 1. Structural validation via JSON Schema
-    errors = list(_compiled_manifest_validator.iter_errors(manifest))
-    if errors:
-        return ValidationResult(
-            valid=False,
-            errors=_format_errors(errors),
-        )
+    if not _fast_is_valid(_fast_manifest_validator, manifest):
+        errors = list(_compiled_manifest_validator.iter_errors(manifest))
+        if errors:
+            return ValidationResult(valid=False, errors=_format_errors(errors))
 
     # 2. Semantic validation
     issues = _validate_semantics(manifest)
@@ -507,7 +574,7 @@ def validate_manifest(manifest: Any) -> ValidationResult:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosisResult:
     explanation: str
     suggestion: str
@@ -601,18 +668,49 @@ def diagnose_error(error_message: str) -> DiagnosisResult | None:
 # ============================================================================
 
 
+@dataclass(slots=True)
+class _DataValidator:
+    """Validators compiled for one schema, reusable while the schema is unchanged."""
+
+    draft7: Draft7Validator
+    fast: Callable[[Any], Any] | None = None
+
+    def validate(self, data: Any) -> ValidationResult:
+        if _fast_is_valid(self.fast, data):
+            return ValidationResult(valid=True)
+
+        errors = list(self.draft7.iter_errors(data))
+
+        if not errors:
+            return ValidationResult(valid=True)
+
+        return ValidationResult(valid=False, errors=_format_errors(errors))
+
+    def is_valid(self, data: Any) -> bool:
+        if _fast_is_valid(self.fast, data):
+            return True
+        return next(self.draft7.iter_errors(data), None) is None
+
+
+def _compile_data_validator(schema: dict[str, Any]) -> _DataValidator:
+    """
+    Compile a schema once for repeated validation (the gateway keeps one per
+    exposed tool). The schema must not be mutated while the result is in use.
+    """
+    return _DataValidator(Draft7Validator(schema), _compile_fast(schema))
+
+
 def validate_data(schema: dict[str, Any], data: Any) -> ValidationResult:
     """
     Validate data against a JSON Schema.
     Used by the gateway for tool-mode input/output validation.
     """
-    validator = Draft7Validator(schema)
-    errors = list(validator.iter_errors(data))
+    return _DataValidator(Draft7Validator(schema)).validate(data)
 
-    if not errors:
-        return ValidationResult(valid=True)
 
-    return ValidationResult(
-        valid=False,
-        errors=_format_errors(errors),
-    )
+def is_valid_data(schema: dict[str, Any], data: Any) -> bool:
+    """
+    Check data against a JSON Schema, stopping at the first error.
+    Use validate_data() when the error messages are needed.
+    """
+    return _DataValidator(Draft7Validator(schema)).is_valid(data)
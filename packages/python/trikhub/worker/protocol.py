@@ -7,10 +7,16 @@ JSON sent over stdin/stdout between the gateway and this worker.
 
 from __future__ import annotations
 
-import uuid
+import itertools
+import json
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Any
+from typing import Any, Final
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover — optional speedup
+    orjson = None  # type: ignore[assignment]
 
 
 # ============================================================================
@@ -37,7 +43,16 @@ class ErrorCode(IntEnum):
 # ============================================================================
 
 
-@dataclass
+# Request ids only need to be unique per connection; a counter avoids the
+# os.urandom() call and UUID formatting that uuid4() costs on every request.
+_request_ids = itertools.count(1)
+
+
+def next_request_id() -> str:
+    return str(next(_request_ids))
+
+
+@dataclass(slots=True)
 class JsonRpcError:
     code: int
     message: str
@@ -50,10 +65,10 @@ class JsonRpcError:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonRpcRequest:
     method: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=next_request_id)
     params: Any = None
     jsonrpc: str = "2.0"
 
@@ -64,7 +79,7 @@ class JsonRpcRequest:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonRpcResponse:
     id: str
     result: Any = None
@@ -97,11 +112,83 @@ def create_request(method: str, params: Any = None) -> JsonRpcRequest:
     return JsonRpcRequest(method=method, params=params)
 
 
+# ============================================================================
+# Framing
+# ============================================================================
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    """
+    Serialize a message to a newline-terminated UTF-8 frame.
+
+    Uses orjson when installed, falling back to the stdlib for payloads orjson
+    rejects (e.g. integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                message, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+
+# Health probes are the one request sent on a timer, and only their id ever
+# changes — so the frame is filled in from bytes rather than serialized.
+_HEALTH_FRAME: Final = b'{"jsonrpc":"2.0","id":"%s","method":"health","params":{}}\n'
+
+
+def encode_health_request(request_id: str) -> bytes:
+    """
+    Frame for a health request with the given id. The id is inserted verbatim,
+    so it must not need JSON escaping (ids from next_request_id() never do).
+    """
+    return _HEALTH_FRAME % request_id.encode()
+
+
+def decode_message(data: bytes | str) -> Any:
+    """Parse one JSON frame. Raises ValueError on malformed input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # ============================================================================
 # Message Parsing
 # ============================================================================
 
 
+def validate_message(msg: Any) -> dict[str, Any]:
+    """
+    Check a decoded frame is a JSON-RPC 2.0 object with a string id and return
+    it. Raises ValueError naming the first problem otherwise.
+
+    A valid frame passes one combined check; the individual reasons are only
+    worked out once that check has failed.
+    """
+    if type(msg) is dict and msg.get("jsonrpc") == "2.0" and type(msg.get("id")) is str:
+        return msg
+
+    if not isinstance(msg, dict):
+        raise ValueError("Message must be an object")
+    if msg.get("jsonrpc") != "2.0":
+        raise ValueError("Invalid JSON-RPC version")
+    raise ValueError("Message ID must be a string")
+
+
+def parse_message(data: bytes | str) -> dict[str, Any]:
+    """
+    Decode and validate one JSON-RPC frame (mirrors parseMessage in
+    worker-protocol.ts). Raises ValueError("Failed to parse JSON-RPC message: ...")
+    if it is not JSON or fails validate_message().
+    """
+    try:
+        return validate_message(decode_message(data))
+    except ValueError as exc:
+        raise ValueError(f"Failed to parse JSON-RPC message: {exc}") from None
+
+
 def is_request(msg: dict[str, Any]) -> bool:
     return "method" in msg
 
@@ -112,7 +199,7 @@ def is_response(msg: dict[str, Any]) -> bool:
 
 def parse_error_object(err: dict[str, Any]) -> JsonRpcError:
     return JsonRpcError(
-        code=err.get("code", ErrorCode.INTERNAL_ERROR),
+        code=err.get("code", ErrorCode.INTERNAL_ERROR.value),
         message=err.get("message", "Unknown error"),
         data=err.get("data"),
     )
@@ -9,7 +9,7 @@ respond on stdin. The main loop routes incoming responses back here.
 from __future__ import annotations
 
 import asyncio
-import uuid
+import secrets
 from typing import Any, Callable
 
 
@@ -69,7 +69,7 @@ class StorageProxy:
     async def _send(self, method: str, params: dict[str, Any]) -> Any:
         import json
 
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
         msg = json.dumps({
             "jsonrpc": "2.0",
             "id": request_id,
@@ -7,6 +7,7 @@ the module and returns the TrikAgent.
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import importlib.util
 import json
@@ -16,6 +17,9 @@ from typing import Any
 
 from trikhub.manifest import TrikAgent
 
+# Standalone module name -> (mtime_ns, size) of the file it was executed from
+_module_versions: dict[str, tuple[int, int]] = {}
+
 
 class TrikLoader:
     """Load and cache Python TrikAgent instances from trik directories."""
@@ -72,13 +76,30 @@ class TrikLoader:
             # Standalone module: load directly via spec
             if parent_dir not in sys.path:
                 sys.path.insert(0, parent_dir)
-            module_name = f"trikhub_trik_{module_file.stem}"
-            spec = importlib.util.spec_from_file_location(module_name, str(module_file))
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Cannot create module spec for {module_file}")
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = mod
-            spec.loader.exec_module(mod)
+            # Key the module name by file path so triks sharing a module stem
+            # (e.g. graph.py) don't collide, and reloads skip re-execution.
+            path_key = hashlib.sha1(str(module_file).encode("utf-8")).hexdigest()[:12]
+            module_name = f"trikhub_trik_{module_file.stem}_{path_key}"
+            # Only reuse the imported module while the file is unchanged, so a
+            # trik upgraded in place is re-executed rather than served stale
+            st = module_file.stat()
+            version = (st.st_mtime_ns, st.st_size)
+            existing = sys.modules.get(module_name)
+            if existing is not None and _module_versions.get(module_name) == version:
+                mod = existing
+            else:
+                spec = importlib.util.spec_from_file_location(module_name, str(module_file))
+                if spec is None or spec.loader is None:
+                    raise ImportError(f"Cannot create module spec for {module_file}")
+                mod = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = mod
+                try:
+                    spec.loader.exec_module(mod)
+                except BaseException:
+                    sys.modules.pop(module_name, None)
+                    _module_versions.pop(module_name, None)
+                    raise
+                _module_versions[module_name] = version
 
         agent: Any = getattr(mod, export_name, None)
         if agent is None:
@@ -2,7 +2,6 @@
 
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from trikhub.gateway.node_worker import (
     NodeWorker,